@@ -66,7 +66,8 @@ class ServoControlApp:
             right_frame,
             self.num_servos,
             get_servo_angles_callback=self.get_current_servo_angles,
-            send_command_callback=self.send_serial_command
+            send_command_callback=self.send_serial_command,
+            send_batch_callback=self.send_serial_batch
         )
         self.sequence_recording.frame.pack(fill="both", expand=True)
           
@@ -115,6 +116,20 @@ class ServoControlApp:
             
         return result
     
+    def send_serial_batch(self, commands):
+        #check connection
+        if not self.serial_connection.is_connected:
+            self.log_message("Error: Not connected to serial port")
+            return False
+            
+        #send all commands in one write
+        result = self.serial_connection.send_batch(commands)
+        
+        if not result:
+            self.log_message("Error sending command batch")
+            
+        return result
+    
     def get_current_servo_angles(self):
         #collect all servo angles
         servo_positions = []
@@ -1,12 +1,69 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import json
-import time
-import threading
+import struct
+import sys
+from array import array
 from servo_motion_editor import ServoMotionEditor
 
+#optional, compiles the sequence schema into a single validator function
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+#optional, much faster json encode/decode for long sequences, falls back to the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+#binary sequence files (.seqb): "<HH" header of servo count and step count, then per step one uint16 per servo position followed by a uint16 delay
+BINARY_EXTENSION = ".seqb"
+BINARY_HEADER = struct.Struct("<HH")
+
+#delays are stored as uint16 milliseconds
+MAX_STEP_DELAY = 65535
+
+SEQUENCE_FILETYPES = [
+    ("JSON files", "*.json"),
+    ("Binary sequence files", f"*{BINARY_EXTENSION}"),
+    ("All files", "*.*")
+]
+
+#recorded steps list layout (pixels)
+LIST_ROW_HEIGHT = 20
+LIST_HEADER_HEIGHT = 22
+LIST_STEP_X = 25 #centre of the step column
+LIST_SERVOS_X = 55 #left edge of the servo positions column
+LIST_DELAY_INSET = 40 #centre of the delay column, measured from the right edge
+
+SEQUENCE_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "required": ["servos", "delay"],
+        "properties": {
+            "servos": {"type": "array"},
+            "delay": {"type": "number"}
+        }
+    }
+}
+
+def _check_sequence(sequence):
+    #fallback when fastjsonschema isn't installed, same checks in one pass
+    if not isinstance(sequence, list):
+        raise ValueError("Invalid sequence format")
+        
+    if not all(type(step) is dict and "servos" in step and "delay" in step for step in sequence):
+        raise ValueError("Invalid step format")
+        
+    return sequence
+
+validate_sequence = fastjsonschema.compile(SEQUENCE_SCHEMA) if fastjsonschema else _check_sequence
+
 class SequenceRecording:
-    def __init__(self, parent, num_servos, get_servo_angles_callback=None, send_command_callback=None):
+    def __init__(self, parent, num_servos, get_servo_angles_callback=None, send_command_callback=None, send_batch_callback=None):
         #create main frame
         self.frame = ttk.LabelFrame(parent, text="Sequence Recording")
         
@@ -14,11 +71,20 @@ class SequenceRecording:
         self.num_servos = num_servos
         self.get_servo_angles = get_servo_angles_callback
         self.send_command = send_command_callback
-        
-        #sequence data
-        self.sequence = []
+        self.send_batch = send_batch_callback #sends a list of commands in one serial write
+        
+        #sequence data, stored as flat arrays (see _set_sequence)
+        self.step_width = num_servos #servos per step
+        self.positions = array('H')
+        self.delays = array('H')
+        self.display_texts = [] #cached servo positions text per step
+        self.sa_prefixes = self._build_sa_prefixes(num_servos)
         self.is_playing = False
-        self.play_thread = None
+        self.play_index = 0 #next step to play
+        self.play_after_id = None #pending after call for the next step
+        
+        #last state applied to each button, so unchanged buttons aren't reconfigured
+        self.button_states = {}
         
         #delay between steps (milliseconds)
         self.delay_var = tk.IntVar(value=500)
@@ -103,33 +169,10 @@ class SequenceRecording:
         display_frame = ttk.LabelFrame(self.frame, text="Recorded Steps")
         display_frame.pack(fill="both", expand=True, padx=5, pady=5)
         
-        #treeview for steps
-        columns = ("Step", "Servos", "Delay")
-        self.step_tree = ttk.Treeview(
-            display_frame,
-            columns=columns,
-            show="headings",
-            selectmode="browse"
-        )
+        #list of steps
+        self._create_step_list(display_frame)
         
-        #column headings
-        self.step_tree.heading("Step", text="Step")
-        self.step_tree.heading("Servos", text="Servo Positions")
-        self.step_tree.heading("Delay", text="Delay (ms)")
-        
-        #column widths
-        self.step_tree.column("Step", width=50, anchor="center")
-        self.step_tree.column("Servos", width=350, anchor="w")
-        self.step_tree.column("Delay", width=80, anchor="center")
-        
-        #scrollbar
-        scrollbar = ttk.Scrollbar(display_frame, orient="vertical", command=self.step_tree.yview)
-        self.step_tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.step_tree.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        #buttons under treeview
+        #buttons under the list
         tree_buttons_frame = ttk.Frame(self.frame)
         tree_buttons_frame.pack(fill="x", padx=5, pady=5)
         
@@ -164,44 +207,60 @@ class SequenceRecording:
             messagebox.showerror("Error", "Invalid servo positions")
             return
         
-        #create step data
-        step = {
-            "servos": servo_positions,
-            "delay": self.delay_var.get()
-        }
+        #check the delay before touching either array so a bad value can't leave a row without its delay
+        try:
+            delay = self.delay_var.get()
+        except tk.TclError:
+            delay = None
+            
+        if delay is None or not (0 <= delay <= MAX_STEP_DELAY):
+            messagebox.showerror("Error", f"Step delay must be between 0 and {MAX_STEP_DELAY} ms")
+            return
         
-        #add to sequence
-        self.sequence.append(step)
+        #a loaded file with a different servo count can't share rows with new recordings, ask before starting fresh
+        if self.step_width != self.num_servos:
+            if self.delays and not messagebox.askyesno(
+                "Confirm",
+                f"The loaded sequence uses {self.step_width} servos, new steps use {self.num_servos}. "
+                "Clear the loaded sequence and record a new one?"):
+                return
+                
+            self._set_sequence(self.num_servos, array('H'), array('H'))
+            self._update_sequence_display()
         
-        #update display
-        self._update_sequence_display()
+        #add to sequence, one row of positions plus its delay
+        self.delays.append(delay)
+        self.positions.extend(servo["position"] for servo in servo_positions)
+        index = len(self.delays) - 1
+        self.display_texts.append(self._format_positions(self._step_positions(index)))
+        
+        #update display, only the new row needs inserting
+        self._append_step_row(index)
         
         #update button states
         self._update_buttons()
     
     def remove_step(self):
-        selected = self.step_tree.selection()
+        index = self.selected_index
         
-        if not selected:
+        if index is None:
             messagebox.showinfo("Info", "No step selected")
             return
         
-        #get index
-        item = selected[0]
-        index = self.step_tree.index(item)
-        
         #remove from sequence
-        if 0 <= index < len(self.sequence):
-            self.sequence.pop(index)
+        if 0 <= index < len(self.delays):
+            del self.positions[index * self.step_width:(index + 1) * self.step_width]
+            del self.delays[index]
+            del self.display_texts[index]
             
-            #update display
-            self._update_sequence_display()
+            #update display, rows after it shift up and renumber
+            self._remove_step_row(index)
             
             #update button states
             self._update_buttons()
     
     def play_sequence(self):
-        if not self.sequence:
+        if not self.delays:
             messagebox.showinfo("Info", "No sequence to play")
             return
         
@@ -214,52 +273,62 @@ class SequenceRecording:
         self.is_playing = True
         self._update_buttons()
         
-        #start sequence playback thread
-        self.play_thread = threading.Thread(target=self._playback_thread)
-        self.play_thread.daemon = True
-        self.play_thread.start()
+        self.play_index = 0
+        
+        #playback runs on the tk main loop, each step schedules the next one after its delay
+        self._play_next_step()
     
-    def _playback_thread(self):
+    def _play_next_step(self):
+        self.play_after_id = None
+        
+        if not self.is_playing or self.play_index >= len(self.delays):
+            self._finish_playback()
+            return
+            
+        i = self.play_index
+        
         try:
-            for i, step in enumerate(self.sequence):
-                if not self.is_playing:
-                    break
-                
-                #highlight current step
-                self.step_tree.selection_set(self.step_tree.get_children()[i])
-                self.step_tree.see(self.step_tree.get_children()[i])
-                
-                #send commands for each servo
-                for servo in step["servos"]:
-                    if not self.is_playing:
-                        break
-                    
-                    servo_id = servo["id"]
-                    position = servo["position"]
-                    
-                    #send servo command
-                    self.send_command(f"SA:{servo_id}:{position}")
-                    time.sleep(0.01)  #small delay between commands
-                
-                #wait for delay
-                if self.is_playing:
-                    time.sleep(step["delay"] / 1000.0) #in ms
+            #highlight current step
+            self._highlight_step(i)
+            
+            #send every servo command for this step together as one pre-built payload
+            payload = b"".join([
+                prefix + str(position).encode() + b"\n"
+                for prefix, position in zip(self.sa_prefixes, self._step_positions(i))
+            ])
+            
+            if self.send_batch:
+                self.send_batch(payload) #one write per step, no gaps between servos
+            else:
+                for command in payload.decode().splitlines():
+                    self.send_command(command)
                     
         except Exception as e:
             print(f"Error during playback: {str(e)}")
             messagebox.showerror("Playback Error", str(e))
-            
-        finally:
-            #reset play state
-            self.is_playing = False
-            
-            #update ui from main thread
-            self.frame.after(0, self._update_buttons)
+            self._finish_playback()
+            return
+        
+        #wait for delay (ms) then play the next step
+        self.play_index += 1
+        self.play_after_id = self.frame.after(self.delays[i], self._play_next_step)
+    
+    def _finish_playback(self):
+        #reset play state
+        self.is_playing = False
+        self._update_buttons()
+    
+    def _highlight_step(self, index):
+        self._select_row(index)
     
     def stop_sequence(self):
-        #stop playback
+        #stop playback, cancelling the pending step straight away
         self.is_playing = False
         
+        if self.play_after_id:
+            self.frame.after_cancel(self.play_after_id)
+            self.play_after_id = None
+        
         #send stop command
         if self.send_command:
             self.send_command("STOP")
@@ -268,34 +337,107 @@ class SequenceRecording:
         self._update_buttons()
     
     def clear_sequence(self):
-        if not self.sequence:
+        if not self.delays:
             return
             
         if messagebox.askyesno("Confirm", "Are you sure you want to clear the sequence?"):
-            self.sequence = []
+            self._set_sequence(self.num_servos, array('H'), array('H'))
             self._update_sequence_display()
             self._update_buttons()
     
+    #-----------------------------------------------------------------------
+    #sequence storage
+    #-----------------------------------------------------------------------
+    #steps are kept as two flat arrays instead of a list of dicts: positions holds step_width values per step (row-major), delays one value per step
+    def _set_sequence(self, step_width, positions, delays):
+        if len(positions) != step_width * len(delays):
+            raise ValueError("Invalid step format")
+            
+        if step_width != self.step_width:
+            self.sa_prefixes = self._build_sa_prefixes(step_width)
+            
+        self.step_width = step_width
+        self.positions = positions
+        self.delays = delays
+        
+        #hoisted lookups, this runs once per step for whole files
+        format_positions = self._format_positions
+        step_positions = self._step_positions
+        self.display_texts = [format_positions(step_positions(i)) for i in range(len(delays))]
+    
+    def _build_sa_prefixes(self, step_width):
+        #"SA:<id>:" never changes per servo, encode it once instead of formatting it every step
+        return [f"SA:{servo_id}:".encode() for servo_id in range(step_width)]
+    
+    def _step_positions(self, index):
+        return self.positions[index * self.step_width:(index + 1) * self.step_width]
+    
+    def _steps_as_dicts(self):
+        #expand to the original step format for json files and the motion editor
+        return [
+            {
+                "servos": [
+                    {"id": servo_id, "name": f"Servo {servo_id}", "position": position}
+                    for servo_id, position in enumerate(self._step_positions(i))
+                ],
+                "delay": delay
+            }
+            for i, delay in enumerate(self.delays)
+        ]
+    
+    def _set_sequence_from_dicts(self, steps):
+        #pack json steps into the flat arrays, positions are stored by column so every step must list servos 0..n-1 in order
+        step_width = len(steps[0]["servos"]) if steps else self.num_servos
+        if step_width > self.num_servos:
+            raise ValueError("Invalid step format")
+            
+        expected_ids = list(range(step_width))
+        positions = array('H')
+        delays = array('H')
+        
+        #hoisted bound methods, the loop runs once per step
+        extend_positions = positions.extend
+        append_delay = delays.append
+        
+        try:
+            for step in steps:
+                servos = step["servos"]
+                if [servo["id"] for servo in servos] != expected_ids:
+                    raise ValueError("Invalid step format")
+                    
+                extend_positions(int(servo["position"]) for servo in servos)
+                append_delay(int(step["delay"]))
+                
+        #uint16 storage rejects negative values and delays over 65535ms
+        except (OverflowError, TypeError, KeyError):
+            raise ValueError("Invalid step format")
+            
+        self._set_sequence(step_width, positions, delays)
+    
     #-----------------------------------------------------------------------
     #file operations
     #-----------------------------------------------------------------------
     def save_sequence(self):
-        if not self.sequence:
+        if not self.delays:
             messagebox.showinfo("Info", "No sequence to save")
             return
             
         #get file path
         file_path = filedialog.asksaveasfilename(
             defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=SEQUENCE_FILETYPES
         )
         
         if not file_path:
             return
             
         try:
-            with open(file_path, 'w') as file:
-                json.dump(self.sequence, file, indent=2)
+            #compact binary format for long recordings, chosen by extension
+            if file_path.lower().endswith(BINARY_EXTENSION):
+                self._save_binary(file_path)
+                
+            else:
+                self._save_json(file_path)
                 
             messagebox.showinfo("Success", f"Sequence saved to {file_path}")
             
@@ -305,26 +447,25 @@ class SequenceRecording:
     def load_sequence(self):
         #get file path
         file_path = filedialog.askopenfilename(
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=SEQUENCE_FILETYPES
         )
         
         if not file_path:
             return
             
         try:
-            with open(file_path, 'r') as file:
-                loaded_sequence = json.load(file)
-                
-            #validate sequence
-            if not isinstance(loaded_sequence, list):
-                raise ValueError("Invalid sequence format")
+            if file_path.lower().endswith(BINARY_EXTENSION):
+                #binary files are validated by their header and load straight into the arrays
+                self._load_binary(file_path)
                 
-            for step in loaded_sequence:
-                if not isinstance(step, dict) or "servos" not in step or "delay" not in step:
-                    raise ValueError("Invalid step format")
+            else:
+                loaded_sequence = self._load_json(file_path)
+                    
+                #validate sequence in one call, raises on the first bad step
+                validate_sequence(loaded_sequence)
+                self._set_sequence_from_dicts(loaded_sequence)
                     
-            #update sequence
-            self.sequence = loaded_sequence
+            #update display
             self._update_sequence_display()
             self._update_buttons()
             
@@ -333,45 +474,263 @@ class SequenceRecording:
         except Exception as e:
             messagebox.showerror("Error", f"Error loading sequence: {str(e)}")
     
+    def _save_json(self, file_path):
+        if orjson:
+            with open(file_path, 'wb') as file:
+                file.write(orjson.dumps(self._steps_as_dicts(), option=orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, 'w') as file:
+                json.dump(self._steps_as_dicts(), file, indent=2)
+    
+    def _load_json(self, file_path):
+        if orjson:
+            with open(file_path, 'rb') as file:
+                return orjson.loads(file.read())
+                
+        with open(file_path, 'r') as file:
+            return json.load(file)
+    
+    def _save_binary(self, file_path):
+        #interleave to one row per step: positions in servo order then the delay
+        values = array('H')
+        extend_values = values.extend
+        append_value = values.append
+        step_positions = self._step_positions
+        
+        for i, delay in enumerate(self.delays):
+            extend_values(step_positions(i))
+            append_value(delay)
+            
+        #file is little endian regardless of platform
+        if sys.byteorder == "big":
+            values.byteswap()
+            
+        with open(file_path, 'wb') as file:
+            file.write(BINARY_HEADER.pack(self.step_width, len(self.delays)))
+            file.write(values.tobytes())
+    
+    def _load_binary(self, file_path):
+        with open(file_path, 'rb') as file:
+            data = file.read()
+            
+        if len(data) < BINARY_HEADER.size:
+            raise ValueError("Invalid sequence format")
+            
+        num_servos, num_steps = BINARY_HEADER.unpack_from(data)
+        if num_servos > self.num_servos:
+            raise ValueError("Invalid step format")
+            
+        row_size = num_servos + 1
+        
+        #parse every value in one go
+        values = array('H')
+        values.frombytes(data[BINARY_HEADER.size:])
+        
+        if sys.byteorder == "big":
+            values.byteswap()
+            
+        if len(values) != num_steps * row_size:
+            raise ValueError("Invalid step format")
+            
+        #split the interleaved rows back into positions and delays
+        positions = array('H')
+        extend_positions = positions.extend
+        
+        for row in range(0, len(values), row_size):
+            extend_positions(values[row:row + num_servos])
+            
+        self._set_sequence(num_servos, positions, values[num_servos::row_size])
+    
     def edit_motion_graph(self):
-        if not self.sequence:
+        if not self.delays:
             messagebox.showinfo("Info", "No sequence to edit")
             return
             
         #create motion editor (currently just a stub)
-        editor = ServoMotionEditor(self.frame, self.sequence)
+        editor = ServoMotionEditor(self.frame, self._steps_as_dicts())
         editor.show()
     
     #-----------------------------------------------------------------------
     #ui update helpers
     #-----------------------------------------------------------------------
+    #full redraw from the top, only needed when the whole sequence is replaced (clear/load)
     def _update_sequence_display(self):
-        #clear current display
-        for item in self.step_tree.get_children():
-            self.step_tree.delete(item)
-            
-        #add sequence steps
-        for i, step in enumerate(self.sequence):
-            #format servo positions text
-            positions_text = ", ".join([
-                f"Servo {servo['id']}: {servo['position']}°" 
-                for servo in step["servos"]
-            ])
+        self.selected_index = None
+        self.list_top = 0
+        self._render_rows(rebuild=True)
+    
+    #format servo positions text once per step and keep it in display_texts, so redraws don't rebuild it
+    def _format_positions(self, positions):
+        return ", ".join([
+            f"Servo {servo_id}: {position}°" 
+            for servo_id, position in enumerate(positions)
+        ])
+    
+    def _append_step_row(self, index):
+        #the new row only gets drawn if it falls inside the visible window
+        self._render_rows()
+    
+    def _remove_step_row(self, index):
+        #every visible row from index down changes, redraw the window
+        self.selected_index = None
+        self._render_rows(rebuild=True)
+    
+    #-----------------------------------------------------------------------
+    #recorded steps list
+    #-----------------------------------------------------------------------
+    #virtualised list on a canvas, only rows inside the visible window exist as canvas items so long sequences stay cheap to draw
+    def _create_step_list(self, parent):
+        self.step_canvas = tk.Canvas(parent, background="white", highlightthickness=0, width=480)
+        self.step_scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self._on_list_scroll)
+        
+        self.step_canvas.pack(side="left", fill="both", expand=True)
+        self.step_scrollbar.pack(side="right", fill="y")
+        
+        self.list_top = 0 #index of the first visible row
+        self.rendered_top = 0 #list_top the current row items were drawn for
+        self.row_items = {} #row index -> canvas item ids for that row
+        self.selected_index = None
+        self.list_size = (480, LIST_HEADER_HEIGHT)
+        
+        #selection highlight, drawn behind the selected row when it is visible
+        self.selection_rect = self.step_canvas.create_rectangle(0, 0, 0, 0, fill="#cce4ff", outline="", state="hidden")
+        
+        #column headings
+        self.header_bg = self.step_canvas.create_rectangle(0, 0, 0, LIST_HEADER_HEIGHT, fill="#e6e6e6", outline="")
+        self.step_canvas.create_text(LIST_STEP_X, LIST_HEADER_HEIGHT // 2, text="Step")
+        self.step_canvas.create_text(LIST_SERVOS_X, LIST_HEADER_HEIGHT // 2, text="Servo Positions", anchor="w")
+        self.delay_header = self.step_canvas.create_text(0, LIST_HEADER_HEIGHT // 2, text="Delay (ms)")
+        
+        self.step_canvas.bind("<Configure>", self._on_list_configure)
+        self.step_canvas.bind("<Button-1>", self._on_list_click)
+        self.step_canvas.bind("<MouseWheel>", self._on_list_wheel) #windows/mac
+        self.step_canvas.bind("<Button-4>", lambda e: self._scroll_rows(-1)) #linux
+        self.step_canvas.bind("<Button-5>", lambda e: self._scroll_rows(1))
+    
+    def _visible_row_count(self):
+        return max(1, (self.list_size[1] - LIST_HEADER_HEIGHT) // LIST_ROW_HEIGHT)
+    
+    def _render_rows(self, rebuild=False):
+        canvas = self.step_canvas
+        width = self.list_size[0]
+        
+        #rebuild drops every row item, used when row contents shift (remove/load/resize)
+        if rebuild:
+            canvas.delete("row")
+            self.row_items = {}
+            
+        count = len(self.delays)
+        visible = self._visible_row_count()
+        self.list_top = max(0, min(self.list_top, count - visible))
+        first = self.list_top
+        last = min(count, first + visible + 1) #one extra for the partly visible bottom row
+        
+        #drop rows that scrolled out of the window
+        for index in [index for index in self.row_items if index < first or index >= last]:
+            canvas.delete(*self.row_items.pop(index))
             
-            #add to treeview
-            self.step_tree.insert(
-                "",
-                "end",
-                values=(i+1, positions_text, step["delay"])
+        #shift rows that are still visible in one call
+        if self.row_items and self.rendered_top != first:
+            canvas.move("row", 0, (self.rendered_top - first) * LIST_ROW_HEIGHT)
+        self.rendered_top = first
+        
+        #create rows that scrolled into the window
+        row_items = self.row_items
+        create_text = canvas.create_text
+        display_texts = self.display_texts
+        delays = self.delays
+        delay_x = width - LIST_DELAY_INSET
+        
+        for index in range(first, last):
+            if index in row_items:
+                continue
+                
+            y = LIST_HEADER_HEIGHT + (index - first) * LIST_ROW_HEIGHT + LIST_ROW_HEIGHT // 2
+            row_items[index] = (
+                create_text(LIST_STEP_X, y, text=index + 1, tags="row"),
+                create_text(LIST_SERVOS_X, y, text=display_texts[index], anchor="w", tags="row"),
+                create_text(delay_x, y, text=delays[index], tags="row")
             )
+            
+        #selection highlight follows the selected row
+        if self.selected_index is not None and first <= self.selected_index < last:
+            top = LIST_HEADER_HEIGHT + (self.selected_index - first) * LIST_ROW_HEIGHT
+            canvas.coords(self.selection_rect, 0, top, width, top + LIST_ROW_HEIGHT)
+            canvas.itemconfigure(self.selection_rect, state="normal")
+        else:
+            canvas.itemconfigure(self.selection_rect, state="hidden")
+            
+        #scrollbar shows the visible window as a fraction of all rows
+        if count:
+            self.step_scrollbar.set(first / count, min(1.0, (first + visible) / count))
+        else:
+            self.step_scrollbar.set(0.0, 1.0)
+    
+    def _scroll_rows(self, amount):
+        self.list_top += amount
+        self._render_rows()
+    
+    def _select_row(self, index):
+        self.selected_index = index
+        
+        #scroll just enough to bring the row into view
+        visible = self._visible_row_count()
+        if index < self.list_top:
+            self.list_top = index
+        elif index >= self.list_top + visible:
+            self.list_top = index - visible + 1
+            
+        self._render_rows()
+    
+    def _on_list_scroll(self, *args):
+        #scrollbar callback, either ("moveto", fraction) or ("scroll", n, "units"/"pages")
+        if args[0] == "moveto":
+            self.list_top = int(float(args[1]) * len(self.delays))
+            self._render_rows()
+        elif args[0] == "scroll":
+            amount = int(args[1]) * (self._visible_row_count() if args[2] == "pages" else 1)
+            self._scroll_rows(amount)
+    
+    def _on_list_wheel(self, event):
+        self._scroll_rows(-1 if event.delta > 0 else 1)
+    
+    def _on_list_click(self, event):
+        if event.y < LIST_HEADER_HEIGHT:
+            return
+            
+        index = self.list_top + (event.y - LIST_HEADER_HEIGHT) // LIST_ROW_HEIGHT
+        if index < len(self.delays):
+            self._select_row(index)
+    
+    def _on_list_configure(self, event):
+        self.list_size = (event.width, event.height)
+        
+        #header spans the new width, delay column follows the right edge
+        self.step_canvas.coords(self.header_bg, 0, 0, event.width, LIST_HEADER_HEIGHT)
+        self.step_canvas.coords(self.delay_header, event.width - LIST_DELAY_INSET, LIST_HEADER_HEIGHT // 2)
+        
+        #row count and column positions may have changed
+        self._render_rows(rebuild=True)
     
     def _update_buttons(self):
-        has_sequence = bool(self.sequence)
+        has_sequence = bool(self.delays)
         
         #enable/disable buttons based on state
-        self.record_button.config(state="disabled" if self.is_playing else "normal")
-        self.play_button.config(state="disabled" if self.is_playing or not has_sequence else "normal")
-        self.stop_button.config(state="normal" if self.is_playing else "disabled")
-        self.clear_button.config(state="disabled" if self.is_playing or not has_sequence else "normal")
-        self.edit_motion_button.config(state="disabled" if self.is_playing or not has_sequence else "normal")
-        self.remove_button.config(state="disabled" if self.is_playing or not has_sequence else "normal")
\ No newline at end of file
+        record_state = "disabled" if self.is_playing else "normal"
+        stop_state = "normal" if self.is_playing else "disabled"
+        edit_state = "disabled" if self.is_playing or not has_sequence else "normal"
+        
+        desired = (
+            (self.record_button, record_state),
+            (self.play_button, edit_state),
+            (self.stop_button, stop_state),
+            (self.clear_button, edit_state),
+            (self.edit_motion_button, edit_state),
+            (self.remove_button, edit_state)
+        )
+        
+        #only touch buttons whose state actually changes
+        for button, state in desired:
+            if self.button_states.get(button) != state:
+                button.config(state=state)
+                self.button_states[button] = state
\ No newline at end of file
@@ -3,6 +3,14 @@ from tkinter import ttk, messagebox
 import serial
 import serial.tools.list_ports
 import time
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+PORT_CACHE_TTL = 2.0 #seconds a port scan is reused before refresh scans again
+SERIAL_BUFFER_SIZE = 65536 #driver rx/tx buffer, big enough for a whole playback step in one write (windows only)
+SERIAL_WRITE_TIMEOUT = 0.1 #seconds before a write gives up, so the writer thread can't block forever
+UI_POLL_MS = 50 #how often the main thread runs updates posted by background threads
 
 class SerialConnection:
     def __init__(self, parent, send_callback=None):
@@ -16,6 +24,20 @@ class SerialConnection:
         self.serial_connection = None #serial object that communicates to actual port
         self.is_connected = False #connect button will change to disconnect if is_connected = True and back to connect if False
         
+        #outgoing bytes are queued here and written by one long-lived thread, so gui callbacks never block on the port
+        self.tx_queue = queue.Queue()
+        self.tx_thread = None
+        
+        #last port scan as (time, ports), refresh clicks inside the ttl reuse it
+        self.port_cache = None
+        
+        #one shared worker for port scans, repeated refresh clicks share the scan already running
+        self.port_executor = ThreadPoolExecutor(max_workers=1)
+        self.port_future = None
+        
+        #tk isn't thread safe, so background threads post ui updates here instead of calling tk themselves
+        self.ui_queue = queue.Queue()
+        
         #serial port settings
         self.port_var = tk.StringVar()
         self.baudrate_var = tk.IntVar(value=115200)
@@ -62,6 +84,9 @@ class SerialConnection:
         self.status_label = ttk.Label(status_frame, text="Disconnected", foreground="red")
         self.status_label.pack(side="left", padx=5)
         
+        #start running posted ui updates on the main thread
+        self.frame.after(UI_POLL_MS, self._poll_ui)
+        
         #refresh port list on startup
         self.refresh_ports()
     
@@ -69,9 +94,38 @@ class SerialConnection:
     #port management functions
     #-----------------------------------------------------------------------
     def refresh_ports(self):
+        #reuse a recent scan instead of enumerating devices again
+        if self.port_cache and time.monotonic() - self.port_cache[0] < PORT_CACHE_TTL:
+            self._apply_ports(self.port_cache[1])
+            return
+            
+        #a scan is already running, its result will update the list
+        if self.port_future and not self.port_future.done():
+            return
+            
+        #comports() can take hundreds of ms (device enumeration on windows), so run it off the main thread
+        self.port_future = self.port_executor.submit(self._enumerate_ports)
+        self.port_future.add_done_callback(self._on_ports_enumerated)
+    
+    def _enumerate_ports(self):
         #find available serial ports
-        ports = [port.device for port in serial.tools.list_ports.comports()]
-        
+        return [port.device for port in serial.tools.list_ports.comports()]
+    
+    def _on_ports_enumerated(self, future):
+        #runs on the worker thread, hand the result back to the main thread
+        try:
+            ports = future.result()
+        except Exception as e:
+            if self.send_callback:
+                self.ui_queue.put(lambda msg=f"Error finding ports: {str(e)}": self.send_callback(msg))
+            return
+            
+        self.ui_queue.put(lambda: self._apply_ports(ports, True))
+    
+    def _apply_ports(self, ports, fresh=False):
+        if fresh:
+            self.port_cache = (time.monotonic(), ports)
+            
         self.port_combo["values"] = ports
         
         if ports and not self.port_var.get():
@@ -103,14 +157,28 @@ class SerialConnection:
             self.serial_connection = serial.Serial(
                 port=selected_port,
                 baudrate=self.baudrate_var.get(),
-                timeout=1
+                timeout=1,
+                write_timeout=SERIAL_WRITE_TIMEOUT,
+                xonxoff=False, #no handshakes, the esp doesn't use flow control
+                rtscts=False,
+                dsrdtr=False
             )
             
+            #larger driver buffers, set_buffer_size only exists on windows
+            try:
+                self.serial_connection.set_buffer_size(rx_size=SERIAL_BUFFER_SIZE, tx_size=SERIAL_BUFFER_SIZE)
+            except AttributeError:
+                pass
+            
             #allow time for connection to stabilise
             time.sleep(2)
             
             self.is_connected = True
             
+            #start the writer thread for this connection
+            self.tx_thread = threading.Thread(target=self._tx_loop, daemon=True)
+            self.tx_thread.start()
+            
             #update ui
             self.status_label.config(text=f"Connected to {selected_port}", foreground="green")
             self.connect_button.config(text="Disconnect")
@@ -132,12 +200,20 @@ class SerialConnection:
             return False
     
     def disconnect(self):
+        self.is_connected = False
+        
+        #let the writer thread finish its current write before the port goes away
+        if self.tx_thread:
+            self.tx_thread.join(timeout=0.5)
+            self.tx_thread = None
+        
+        #anything still queued was meant for this connection, drop it
+        self._clear_tx_queue()
+        
         if self.serial_connection:
             #close the connection
             self.serial_connection.close()
             self.serial_connection = None
-            
-        self.is_connected = False
         
         #update ui
         self.status_label.config(text="Disconnected", foreground="red")
@@ -161,8 +237,8 @@ class SerialConnection:
             if not command.endswith('\n'):
                 command += '\n'
                 
-            #write to serial port
-            self.serial_connection.write(command.encode('utf-8'))
+            #queue for the writer thread, returns straight away
+            self.tx_queue.put(command.encode('utf-8'))
             
             if self.send_callback:
                 self.send_callback(f"Sent: {command.strip()}") #log on console
@@ -175,6 +251,82 @@ class SerialConnection:
                 
             return False
     
+    def send_batch(self, commands):
+        if not self.is_connected or not self.serial_connection:
+            return False
+        
+        try:
+            #a pre-built bytes payload (newline terminated commands) is queued as is
+            if isinstance(commands, bytes):
+                payload = commands
+                count = payload.count(b'\n')
+                
+            else:
+                commands = list(commands)
+                
+                #join every command into one payload so the whole batch goes out in a single write
+                payload = "".join(command if command.endswith('\n') else command + '\n' for command in commands).encode('utf-8')
+                count = len(commands)
+                
+            if not payload:
+                return True
+                
+            self.tx_queue.put(payload)
+            
+            if self.send_callback:
+                self.send_callback(f"Sent batch: {count} commands") #log on console
+                
+            return True
+                
+        except Exception as e:
+            if self.send_callback:
+                self.send_callback(f"Error sending batch: {str(e)}")
+                
+            return False
+    
+    def _tx_loop(self):
+        #runs on the writer thread until disconnect
+        while self.is_connected:
+            try:
+                chunk = self.tx_queue.get(timeout=0.1) #wake up regularly to notice a disconnect
+            except queue.Empty:
+                continue
+            
+            #coalesce everything else already queued into the same write
+            chunks = [chunk]
+            while True:
+                try:
+                    chunks.append(self.tx_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                self.serial_connection.write(b"".join(chunks))
+                
+            except Exception as e:
+                #log from the main thread
+                if self.send_callback:
+                    self.ui_queue.put(lambda msg=f"Error sending command: {str(e)}": self.send_callback(msg))
+    
+    def _poll_ui(self):
+        #main thread only, run every update background threads have posted
+        while True:
+            try:
+                update = self.ui_queue.get_nowait()
+            except queue.Empty:
+                break
+                
+            update()
+            
+        self.frame.after(UI_POLL_MS, self._poll_ui)
+    
+    def _clear_tx_queue(self):
+        while True:
+            try:
+                self.tx_queue.get_nowait()
+            except queue.Empty:
+                break
+    
     def get_connection(self):
         #return the serial connection object if needed externally
         return self.serial_connection if self.is_connected else None
\ No newline at end of file
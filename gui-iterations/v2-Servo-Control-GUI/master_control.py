@@ -1,15 +1,17 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import time
 
 class MasterControl:
     def __init__(self, parent, send_command_callback=None, num_servos=5):
         self.frame = ttk.LabelFrame(parent, text="Master Control")
         
-        self.send_command = send_command_callback #_handle_master_command (MA:{angle}) from single controls.py
+        self.send_command = send_command_callback #_handle_master_command(angle, command) from single controls.py
         
         self.num_servos = num_servos
         self.master_angle = tk.IntVar(value=90) #set default position to 90
+        self.pending_send = None #after id of the coalesced slider send
+        self.last_sent_angle = None #angle of the last MA command sent during the current slider drag, repeats of it are skipped
+        self.master_commands = [f"MA:{angle}\n".encode('utf-8') for angle in range(181)] #every MA command pre-encoded once, indexed by angle
 
         self._create_ui()
         
@@ -30,6 +32,7 @@ class MasterControl:
             command=self._on_slider_changed
         )
         self.slider.pack(fill="x", pady=5)
+        self.slider.bind("<ButtonRelease-1>", self._on_slider_released)
         
         #min/max labels
         min_max_frame = ttk.Frame(slider_frame)
@@ -57,16 +60,32 @@ class MasterControl:
     #-----------------------------------------------------------------------
     #event handlers
     #-----------------------------------------------------------------------
-    def _on_slider_changed(self, event=None): #when slider changes, get the current angle it is on and send the command
-        # angle = self.master_angle.get()
-        current_time = time.time()
-        if not hasattr(self, '_last_command_time') or (current_time - self._last_command_time) > 0.05:
-            angle = self.master_angle.get()
+    def _on_slider_changed(self, event=None): #slider fires on every pixel of a drag, so schedule one send per 50ms window (same as the individual servo sliders)
+        if self.pending_send is None:
+            self.pending_send = self.frame.after(50, self._flush_slider)
+    
+    def _flush_slider(self): #send the angle the slider ended up on when the window closes, so the final position of a drag is never dropped
+        self.pending_send = None
+        angle = self.master_angle.get()
+        
+        #slider events often land on the same integer angle, nothing to send
+        if angle == self.last_sent_angle:
+            return
+
+        if self.send_command:
+            result = self.send_command(angle, self.master_commands[angle] if 0 <= angle <= 180 else f"MA:{angle}")
+            if result:
+                self.last_sent_angle = angle
+
+    def _on_slider_released(self, event=None): #send any pending angle now and end the drag, servos can be moved elsewhere before the next one so it must always send
+        if self.pending_send is not None:
+            self.frame.after_cancel(self.pending_send)
+            self._flush_slider()
+        self.last_sent_angle = None
 
-            if self.send_command:
-                result = self.send_command(f"MA:{angle}")
-                if result:
-                    self._last_command_time = current_time
+    def _send_angle_now(self): #entry and +/- are single deliberate changes, send them even if the angle matches the last drag
+        self.last_sent_angle = None
+        self._on_slider_changed()
 
     def _on_angle_entry(self, event=None): #when user enters angle from text entry field
         try:
@@ -80,7 +99,7 @@ class MasterControl:
             angle = int(float(entry_value))
             if 0 <= angle <= 180: #ensure entered angle is between 0 and 180
                 self.master_angle.set(angle)
-                self._on_slider_changed()
+                self._send_angle_now()
 
             else:
                 raise ValueError("Angle must be between 0 and 180")
@@ -102,13 +121,13 @@ class MasterControl:
         current = self.master_angle.get()
         if current < 180:
             self.master_angle.set(current + 1)
-            self._on_slider_changed()
+            self._send_angle_now()
     
     def _decrement_angle(self): #decrementor button, decreases current angle by 1
         current = self.master_angle.get()
         if current > 0:
             self.master_angle.set(current - 1)
-            self._on_slider_changed()
+            self._send_angle_now()
     
 #-----------------------------------------------------------------------
 #optional method incase we want to set the angle without sending command to serial; not currently used
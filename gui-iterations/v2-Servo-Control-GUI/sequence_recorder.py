@@ -3,8 +3,6 @@ from tkinter import ttk, messagebox, filedialog
 import json
 import time
 import threading
-import copy
-from servo_motion_editor import ServoMotionEditor
 
 class SequenceRecording:
     def __init__(self, parent, num_servos, get_servo_angles_callback=None, send_command_callback=None):
@@ -436,8 +434,9 @@ class SequenceRecording:
                 keyframe = {
                     'time': step_time,
                     'angle': servo_data.get('position', servo_data.get('angle', 90)),
-                    'cp_in': copy.deepcopy(servo_data.get('cp_in')),
-                    'cp_out': copy.deepcopy(servo_data.get('cp_out'))
+                    # Control points are flat {dt, da} dicts, a shallow copy keeps the step data untouched
+                    'cp_in': dict(servo_data['cp_in']) if servo_data.get('cp_in') else None,
+                    'cp_out': dict(servo_data['cp_out']) if servo_data.get('cp_out') else None
                 }
                 
                 result[servo_id].append(keyframe)
@@ -598,6 +597,9 @@ class SequenceRecording:
         # Convert sequence to format needed by motion editor
         editor_data = self._convert_to_bezier_format()
         
+        # Imported here so numpy and matplotlib only load once the editor is actually used
+        from servo_motion_editor import ServoMotionEditor
+        
         # Create motion editor
         editor = ServoMotionEditor(
             self.frame,
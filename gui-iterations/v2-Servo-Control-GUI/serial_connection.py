@@ -17,6 +17,7 @@ class SerialConnection:
         #connection state
         self.serial_connection = None #serial object that communicates to actual port
         self.is_connected = False #connect button will change to disconnect if is_connected = True and back to connect if False
+        self.sent_log_text = {} #pre-encoded command -> its console log line, so repeated bytes sends don't decode again
         
         #serial port settings
         self.port_var = tk.StringVar()
@@ -161,15 +162,24 @@ class SerialConnection:
             return False
             
         try:
-            #add newline to command if needed
-            if not command.endswith('\n'):
-                command += '\n'
+            #pre-encoded commands (bytes) skip formatting and encoding
+            if isinstance(command, bytes):
+                payload = command if command.endswith(b'\n') else command + b'\n'
+                log_text = self.sent_log_text.get(command)
+                if log_text is None:
+                    log_text = self.sent_log_text[command] = f"Sent: {command.decode('utf-8').strip()}"
+            else:
+                #add newline to command if needed
+                if not command.endswith('\n'):
+                    command += '\n'
+                payload = command.encode('utf-8')
+                log_text = f"Sent: {command.strip()}"
                 
             #write to serial port
-            self.serial_connection.write(command.encode('utf-8'))
+            self.serial_connection.write(payload)
             
             if self.send_callback:
-                self.send_callback(f"Sent: {command.strip()}") #log on console
+                self.send_callback(log_text) #log on console
                 
             return True
                 
@@ -1,14 +1,212 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.widgets import Slider, TextBox, Button
-from matplotlib.lines import Line2D
-import copy
 import logging
+import threading
+import queue
 import time
 
+# numba is optional, it compiles the Bezier sampler into a loop that writes samples straight into the output
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# matplotlib is the slowest import in the GUI, so it is loaded by _import_matplotlib when an editor window opens
+plt = None
+FigureCanvasTkAgg = NavigationToolbar2Tk = None
+Line2D = LineCollection = None
+
+# Pixel radius used when hit-testing keyframes and control points around the mouse position
+PICK_RADIUS_PX = 10
+
+# Playback line timing: ticker period, and the least line movement worth redrawing for
+PLAYBACK_TICK_MS = 50
+PLAYBACK_MIN_REDRAW_MS = 20
+
+# Points sampled along each curve segment
+BEZIER_SAMPLES = 100
+
+# Shortest gap between SA commands sent while dragging a keyframe (about 30 per second)
+DRAG_SEND_INTERVAL_S = 1 / 30
+
+# How often the Tk thread drains playback commands queued by the play thread
+PLAY_QUEUE_POLL_MS = 10
+
+
+def _import_matplotlib():
+    """Import the matplotlib pieces the editor uses into the module namespace."""
+    global plt, FigureCanvasTkAgg, NavigationToolbar2Tk, Line2D, LineCollection
+    if plt is not None:
+        return
+        
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+    from matplotlib.lines import Line2D
+    from matplotlib.collections import LineCollection
+
+
+def _bernstein_basis(num_points):
+    """Cubic Bernstein basis sampled at num_points evenly spaced t, shape (4, num_points)."""
+    t = np.linspace(0, 1, num_points)
+    mt = 1 - t
+    return np.vstack((mt**3, 3 * mt**2 * t, 3 * mt * t**2, t**3))
+
+
+def _sample_bezier_vectorised(control_polygons, basis):
+    """Sample cubic segments with one matmul, used without numba.
+    
+    Args:
+        control_polygons: (segments, 2, 4) array of P0..P3 for time and angle
+        basis: (4, samples) Bernstein basis
+    
+    Returns:
+        Array of shape (segments, samples, 2)
+    """
+    return (control_polygons @ basis).transpose(0, 2, 1)
+
+
+def _sample_bezier_scan(control_polygons, basis):
+    """Same sampling as a scalar loop, compiled by numba so it needs no temporary arrays.
+    
+    Each segment is folded into power form once, then every sample is three
+    multiply-adds in Horner form. The basis is only used for its sample count.
+    """
+    segment_count = control_polygons.shape[0]
+    sample_count = basis.shape[1]
+    step = 1.0 / (sample_count - 1)
+    samples = np.empty((segment_count, sample_count, 2))
+    
+    for segment in range(segment_count):
+        for axis in range(2):
+            p0 = control_polygons[segment, axis, 0]
+            p1 = control_polygons[segment, axis, 1]
+            p2 = control_polygons[segment, axis, 2]
+            p3 = control_polygons[segment, axis, 3]
+            
+            # Power form coefficients: a*t^3 + b*t^2 + c*t + d
+            a = -p0 + 3 * p1 - 3 * p2 + p3
+            b = 3 * p0 - 6 * p1 + 3 * p2
+            c = 3 * (p1 - p0)
+            
+            for k in range(sample_count):
+                t = k * step
+                samples[segment, k, axis] = ((a * t + b) * t + c) * t + p0
+    
+    return samples
+
+
+if njit:
+    _sample_bezier = njit(cache=True, fastmath=True)(_sample_bezier_scan)
+else:
+    _sample_bezier = _sample_bezier_vectorised
+
+
+def _to_number(value):
+    """Convert a numpy scalar to a plain int when it is whole, else a float."""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+class ServoTrack:
+    """Keyframes for a single servo, stored as parallel numpy arrays.
+    
+    Keyframe i sits at (times[i], angles[i]). Its control points are stored
+    relative to it in cp_in_dt/cp_in_da and cp_out_dt/cp_out_da, with NaN
+    where the control point is absent. Keyframes are kept sorted by time.
+    """
+    
+    COLUMNS = ('times', 'angles', 'cp_in_dt', 'cp_in_da', 'cp_out_dt', 'cp_out_da')
+    
+    def __init__(self, times=(), angles=(), cp_in_dt=None, cp_in_da=None, cp_out_dt=None, cp_out_da=None):
+        self.times = np.array(times, dtype=np.float64)
+        self.angles = np.array(angles, dtype=np.float64)
+        num_keyframes = len(self.times)
+        self.cp_in_dt = self._cp_array(cp_in_dt, num_keyframes)
+        self.cp_in_da = self._cp_array(cp_in_da, num_keyframes)
+        self.cp_out_dt = self._cp_array(cp_out_dt, num_keyframes)
+        self.cp_out_da = self._cp_array(cp_out_da, num_keyframes)
+    
+    @staticmethod
+    def _cp_array(values, num_keyframes):
+        """Build a control point column, all NaN when no values are given."""
+        if values is None:
+            return np.full(num_keyframes, np.nan, dtype=np.float64)
+        return np.array(values, dtype=np.float64)
+    
+    @classmethod
+    def from_keyframes(cls, keyframes):
+        """Build a track from a list of keyframe dicts.
+        
+        Args:
+            keyframes: Dicts with time, angle, cp_in and cp_out ({dt, da} or None)
+        """
+        keyframes = sorted(keyframes, key=lambda kf: kf['time'])
+        
+        def cp_column(cp_key, field):
+            return [kf[cp_key][field] if kf.get(cp_key) else np.nan for kf in keyframes]
+        
+        return cls(
+            [kf['time'] for kf in keyframes],
+            [kf['angle'] for kf in keyframes],
+            cp_column('cp_in', 'dt'), cp_column('cp_in', 'da'),
+            cp_column('cp_out', 'dt'), cp_column('cp_out', 'da')
+        )
+    
+    def __len__(self):
+        return len(self.times)
+    
+    def add(self, time_ms, angle):
+        """Add a keyframe without control points, keeping the track sorted.
+        
+        Returns:
+            Index of the new keyframe
+        """
+        # Track is already sorted, so find the slot instead of re-sorting; ties go after existing keyframes
+        index = int(np.searchsorted(self.times, time_ms, side='right'))
+        
+        values = (time_ms, angle, np.nan, np.nan, np.nan, np.nan)
+        for name, value in zip(self.COLUMNS, values):
+            column = getattr(self, name)
+            setattr(self, name, np.insert(column, index, column.dtype.type(value)))
+        return index
+    
+    def pop(self, index):
+        """Remove the keyframe at index."""
+        for name in self.COLUMNS:
+            setattr(self, name, np.delete(getattr(self, name), index))
+    
+    def control_point_arrays(self, cp_type):
+        """Return the (dt, da) columns for the 'in' or 'out' control points."""
+        if cp_type == 'in':
+            return self.cp_in_dt, self.cp_in_da
+        return self.cp_out_dt, self.cp_out_da
+    
+    def has_control_points(self, cp_type):
+        """Boolean mask of keyframes that have an 'in' or 'out' control point."""
+        return ~np.isnan(self.control_point_arrays(cp_type)[0])
+    
+    def control_point_coords(self, cp_type):
+        """Absolute (time, angle) of every 'in' or 'out' control point, shape (K, 2).
+        
+        Angles are clamped to 0-180; rows for absent control points are NaN.
+        """
+        dt, da = self.control_point_arrays(cp_type)
+        return np.column_stack((self.times + dt, np.clip(self.angles + da, 0, 180)))
+    
+    def to_legacy_list(self):
+        """Return the keyframes as a list of dicts, as used by the sequence recorder."""
+        keyframes = []
+        for i in range(len(self)):
+            kf = {'time': _to_number(self.times[i]), 'angle': _to_number(self.angles[i]), 'cp_in': None, 'cp_out': None}
+            if not np.isnan(self.cp_in_dt[i]):
+                kf['cp_in'] = {'dt': float(self.cp_in_dt[i]), 'da': float(self.cp_in_da[i])}
+            if not np.isnan(self.cp_out_dt[i]):
+                kf['cp_out'] = {'dt': float(self.cp_out_dt[i]), 'da': float(self.cp_out_da[i])}
+            keyframes.append(kf)
+        return keyframes
+
+
 class ServoMotionEditor:
     def __init__(self, parent, sequence=None, send_command_callback=None, sequence_update_callback=None):
         """Initialise the motion editor for Bezier curve-based servo control.
@@ -24,22 +222,18 @@ class ServoMotionEditor:
         self.sequence_update_callback = sequence_update_callback
         self.send_command = send_command_callback
         
-        # Create a deep copy of the sequence data for editing
+        # Copy the sequence data into per-servo tracks for editing
         self.all_sequences = self._convert_to_editor_format(sequence) if sequence else {}
         
         # Set defaults if we received empty data
         if not self.all_sequences:
             # Create a default sequence with one servo
-            self.all_sequences = {
-                0: [
-                    {'time': 0, 'angle': 90, 'cp_in': None, 'cp_out': None},
-                    {'time': 1000, 'angle': 120, 'cp_in': None, 'cp_out': None}
-                ]
-            }
+            self.all_sequences = {0: ServoTrack([0, 1000], [90, 120])}
         
         # Current servo being edited
         self.servo_ids = sorted(list(self.all_sequences.keys()))
         self.current_servo_id = self.servo_ids[0] if self.servo_ids else 0
+        self.sa_prefix = f"SA:{self.current_servo_id}:"  # Kept in step with current_servo_id for drag sends
         
         # Ensure default control points for all sequences
         for servo_id in self.servo_ids:
@@ -49,12 +243,29 @@ class ServoMotionEditor:
         self.scroll_window = 2000  # Width of visible x-axis window in ms
         self.selected_kf_index = None
         self.dragging_element = None
+        self.drag_sent_angle = None  # Last angle sent to the servo while dragging, and when
+        self.drag_sent_time = 0.0
         self.save_status = "Not Saved"
         
+        # Recorder-format keyframes per servo, only rebuilt for servos edited since the last save
+        self.recorder_keyframes = {}
+        self.dirty_servos = set(self.servo_ids)
+        self.serial_strings = {}  # LOAD_SEQ keyframe strings per servo, dropped whenever the servo is edited
+        self.status_pending = None  # after_idle id of the queued status label update
+        
+        # Sampling resolution is fixed, so the Bernstein basis is built once
+        self.bezier_basis = _bernstein_basis(BEZIER_SAMPLES)
+        self.curve_cache = {}  # servo_id -> (control polygons, samples) from the last replot
+        
         # Playback state variables
         self.playback_active = False
         self.playback_duration = 0
-        self.playback_start_time = 0
+        self.playback_start_ns = 0  # time.monotonic_ns() when playback started
+        self.playback_drawn_ms = 0  # Elapsed time the playback line was last drawn at
+        self.blit_background = None  # Axes pixels without the animated artists, for blitting
+        self.play_thread = None
+        self.play_stop_event = threading.Event()  # Stop event of the latest dispatch, set to abort it while loading
+        self.pending_angle_entry = None  # after id of the queued angle entry edit
         
         # Create the editor window as a Toplevel
         self._create_editor_window()
@@ -63,18 +274,17 @@ class ServoMotionEditor:
         """Convert from sequence_recorder format to editor format.
         
         The editor uses a dictionary where keys are servo IDs and values are
-        lists of keyframes, where each keyframe is a dictionary with time, angle,
-        cp_in, and cp_out.
+        ServoTrack objects holding that servo's keyframes.
         """
         if not sequence:
             return {}
             
         result = {}
         
-        # Check if the sequence is already in the right format
+        # Check if the sequence is already {servo_id: [keyframes]}
         if isinstance(sequence, dict) and all(isinstance(sequence[k], list) for k in sequence):
-            # Already in the correct format, just deep copy
-            return copy.deepcopy(sequence)
+            # Tracks copy the values into their own arrays, so no deep copy is needed
+            return {servo_id: ServoTrack.from_keyframes(keyframes) for servo_id, keyframes in sequence.items()}
         
         # Otherwise, assume it's in the sequence_recorder format:
         # List of steps, each step has time, delay, and list of servos
@@ -90,26 +300,39 @@ class ServoMotionEditor:
                 keyframe = {
                     'time': time_ms,
                     'angle': servo_data['position'] if 'position' in servo_data else servo_data['angle'],
-                    'cp_in': copy.deepcopy(servo_data.get('cp_in')),
-                    'cp_out': copy.deepcopy(servo_data.get('cp_out'))
+                    'cp_in': servo_data.get('cp_in'),
+                    'cp_out': servo_data.get('cp_out')
                 }
                 
                 result[servo_id].append(keyframe)
                 
-        return result
-        
+        return {servo_id: ServoTrack.from_keyframes(keyframes) for servo_id, keyframes in result.items()}
+        
+    def _mark_dirty(self, servo_id=None):
+        """Flag a servo's keyframes as changed since the last save (default: current servo)."""
+        if servo_id is None:
+            servo_id = self.current_servo_id
+        self.dirty_servos.add(servo_id)
+        self.serial_strings.pop(servo_id, None)
+    
     def _convert_to_recorder_format(self):
         """Convert from editor format back to sequence_recorder format."""
         if not self.all_sequences:
             return []
             
-        # Get all unique times across all servo sequences
-        all_times = set()
-        for servo_id, keyframes in self.all_sequences.items():
-            for kf in keyframes:
-                all_times.add(kf['time'])
+        # Only servos edited since the last save need converting again
+        for servo_id in self.dirty_servos:
+            if servo_id in self.all_sequences:
+                self.recorder_keyframes[servo_id] = self.all_sequences[servo_id].to_legacy_list()
+        self.dirty_servos.clear()
+        
+        # Group keyframes by time in a single pass; the first keyframe per servo at a time wins
+        by_time = {}
+        for servo_id in self.all_sequences:
+            for kf in self.recorder_keyframes[servo_id]:
+                by_time.setdefault(kf['time'], {}).setdefault(servo_id, kf)
         
-        sorted_times = sorted(list(all_times))
+        sorted_times = sorted(by_time)
         
         # Create steps at each unique time
         result = []
@@ -117,28 +340,18 @@ class ServoMotionEditor:
             step = {
                 'time': time_ms,
                 'delay': sorted_times[idx+1] - time_ms if idx < len(sorted_times) - 1 else 500,
-                'servos': []
-            }
-            
-            # For each servo, find the keyframe at this time if it exists
-            for servo_id in self.all_sequences:
-                # Find keyframe at this time
-                matching_kf = None
-                for kf in self.all_sequences[servo_id]:
-                    if kf['time'] == time_ms:
-                        matching_kf = kf
-                        break
-                
-                if matching_kf:
-                    # Add this servo's data to the step
-                    servo_data = {
+                'servos': [
+                    {
                         'id': servo_id,
-                        'position': matching_kf['angle'],
-                        'angle': matching_kf['angle'],
-                        'cp_in': copy.deepcopy(matching_kf.get('cp_in')),
-                        'cp_out': copy.deepcopy(matching_kf.get('cp_out'))
+                        'position': kf['angle'],
+                        'angle': kf['angle'],
+                        # Cached keyframes are reused across saves, so hand out copies of the control points
+                        'cp_in': dict(kf['cp_in']) if kf['cp_in'] else None,
+                        'cp_out': dict(kf['cp_out']) if kf['cp_out'] else None
                     }
-                    step['servos'].append(servo_data)
+                    for servo_id, kf in by_time[time_ms].items()
+                ]
+            }
             
             result.append(step)
             
@@ -146,6 +359,8 @@ class ServoMotionEditor:
     
     def _create_editor_window(self):
         """Create the motion editor window."""
+        _import_matplotlib()
+        
         self.window = tk.Toplevel(self.parent)
         self.window.title(f"Servo Motion Editor - Servo {self.current_servo_id}")
         self.window.geometry("1000x700")
@@ -174,11 +389,13 @@ class ServoMotionEditor:
         # Bottom controls
         self._create_bottom_controls(main_frame)
         
-        # Set up plot elements
+        # Set up plot elements (created once in setup_plot, then updated in place)
         self.keyframe_scatter = None
-        self.curve_segment_lines = {}
-        self.control_point_scatter = {}
-        self.control_handle_lines = {}
+        self.curve_collection = None  # One LineCollection holding every curve segment
+        self.control_point_scatter = None  # Single scatter holding every control point
+        self.control_point_keys = []  # (kf_index, cp_type) for each point in control_point_scatter
+        self.control_point_positions = np.empty((0, 2))  # Data coordinates matching control_point_keys
+        self.handle_collection = None  # One LineCollection holding every control point handle
         self.playback_line = None
         
         # Initialize plot
@@ -214,7 +431,8 @@ class ServoMotionEditor:
         save_frame = ttk.Frame(toolbar_frame)
         save_frame.pack(side="right", padx=10)
         
-        self.status_label = ttk.Label(save_frame, text=f"Status: {self.save_status}")
+        self.status_var = tk.StringVar(value=f"Status: {self.save_status}")
+        self.status_label = ttk.Label(save_frame, textvariable=self.status_var)
         self.status_label.pack(side="left", padx=5)
         
         ttk.Button(save_frame, text="Save Current Servo", 
@@ -270,13 +488,18 @@ class ServoMotionEditor:
         try:
             new_id = int(selection)
             if new_id in self.servo_ids and new_id != self.current_servo_id:
-                self.current_servo_id = new_id
-                self.clear_selection()
-                self.update_plot_for_current_servo()
-                self.window.title(f"Servo Motion Editor - Servo {self.current_servo_id}")
+                self._switch_servo(new_id)
         except ValueError:
             pass
     
+    def _switch_servo(self, servo_id):
+        """Make servo_id the servo being edited and show its sequence."""
+        self.current_servo_id = servo_id
+        self.sa_prefix = f"SA:{servo_id}:"
+        self.clear_selection()
+        self.update_plot_for_current_servo()
+        self.window.title(f"Servo Motion Editor - Servo {self.current_servo_id}")
+    
     def _prev_servo(self):
         """Switch to previous servo."""
         if not self.servo_ids:
@@ -284,11 +507,8 @@ class ServoMotionEditor:
             
         current_index = self.servo_ids.index(self.current_servo_id)
         prev_index = (current_index - 1) % len(self.servo_ids)
-        self.current_servo_id = self.servo_ids[prev_index]
+        self._switch_servo(self.servo_ids[prev_index])
         self.servo_selector.set(str(self.current_servo_id))
-        self.clear_selection()
-        self.update_plot_for_current_servo()
-        self.window.title(f"Servo Motion Editor - Servo {self.current_servo_id}")
     
     def _next_servo(self):
         """Switch to next servo."""
@@ -297,11 +517,8 @@ class ServoMotionEditor:
             
         current_index = self.servo_ids.index(self.current_servo_id)
         next_index = (current_index + 1) % len(self.servo_ids)
-        self.current_servo_id = self.servo_ids[next_index]
+        self._switch_servo(self.servo_ids[next_index])
         self.servo_selector.set(str(self.current_servo_id))
-        self.clear_selection()
-        self.update_plot_for_current_servo()
-        self.window.title(f"Servo Motion Editor - Servo {self.current_servo_id}")
     
     def _save_current_servo(self):
         """Save changes for the current servo back to the original sequence."""
@@ -311,8 +528,7 @@ class ServoMotionEditor:
             
             # Update via callback
             self.sequence_update_callback(updated_sequence)
-            self.save_status = "Saved"
-            self.status_label.config(text=f"Status: {self.save_status}")
+            self._set_status("Saved")
             
             logging.info(f"Saved changes for Servo {self.current_servo_id}")
     
@@ -324,33 +540,61 @@ class ServoMotionEditor:
             
             # Update via callback
             self.sequence_update_callback(updated_sequence)
-            self.save_status = "Saved"
-            self.status_label.config(text=f"Status: {self.save_status}")
+            self._set_status("Saved")
             
             logging.info("Saved changes for all edited servos")
     
+    def _set_status(self, status):
+        """Set the save status, updating the label once Tk is idle.
+        
+        Drags and typing report every change, so repeated updates are
+        coalesced into a single label config.
+        """
+        if status == self.save_status:
+            return
+            
+        self.save_status = status
+        if self.status_pending is None:
+            self.status_pending = self.window.after_idle(self._flush_status)
+    
+    def _flush_status(self):
+        """Show the latest save status through the label's variable."""
+        self.status_pending = None
+        text = f"Status: {self.save_status}"
+        if self.status_var.get() != text:
+            self.status_var.set(text)
+    
+    def _get_serial_string(self, servo_id):
+        """Get the LOAD_SEQ keyframe string for a servo, formatting it only after edits."""
+        seq_str = self.serial_strings.get(servo_id)
+        if seq_str is None:
+            seq_str = self._format_sequence_for_serial(self.all_sequences[servo_id])
+            self.serial_strings[servo_id] = seq_str
+        return seq_str
+    
     def _format_sequence_for_serial(self, sequence):
-        """Format a sequence for LOAD_SEQ command."""
-        parts = []
-        for kf in sequence:
-            time_val = int(round(kf['time']))
-            angle_val = int(round(kf['angle']))
-            cp_in = kf.get('cp_in')
-            cp_out = kf.get('cp_out')
-
-            in_dt_str = str(int(round(cp_in['dt']))) if cp_in else ""
-            in_da_str = str(int(round(cp_in['da']))) if cp_in else ""
-            out_dt_str = str(int(round(cp_out['dt']))) if cp_out else ""
-            out_da_str = str(int(round(cp_out['da']))) if cp_out else ""
-
-            parts.append(f"{time_val},{angle_val},{in_dt_str},{in_da_str},{out_dt_str},{out_da_str}")
-        return ";".join(parts)
+        """Format a sequence for LOAD_SEQ command.
+        
+        Each column of the track is rounded and turned into text in one go;
+        absent control points become empty fields.
+        """
+        fields = []
+        for column in (sequence.times, sequence.angles, sequence.cp_in_dt,
+                       sequence.cp_in_da, sequence.cp_out_dt, sequence.cp_out_da):
+            missing = np.isnan(column)
+            text = np.round(np.where(missing, 0, column)).astype(np.int64).astype(str)
+            fields.append(np.where(missing, "", text))
+        
+        return ";".join(",".join(row) for row in zip(*fields))
     
     def _get_sequence_duration(self, sequence):
-        """Calculate the duration of a sequence in milliseconds."""
+        """Calculate the duration of a sequence in milliseconds.
+        
+        Tracks are kept sorted by time, so the last keyframe ends the sequence.
+        """
         if not sequence:
             return 0
-        return max(kf['time'] for kf in sequence)
+        return float(sequence.times[-1])
     
     def _play_current_servo(self):
         """Play the current servo's sequence on the hardware."""
@@ -366,22 +610,16 @@ class ServoMotionEditor:
         # Stop any existing playback
         self._stop_playback()
         
-        # Send commands to ESP
-        self.send_command("STOP")
-        time.sleep(0.2)
-        self.send_command("CLEAR_ALL")
-        time.sleep(0.2)
-        
-        # Format and send sequence
-        seq_str = self._format_sequence_for_serial(sequence)
-        self.send_command(f"LOAD_SEQ:{self.current_servo_id}:{seq_str}")
-        time.sleep(0.3)
+        # Format the sequence here so the thread never reads keyframes being edited
+        seq_str = self._get_serial_string(self.current_servo_id)
+        commands = [
+            ("STOP", 0.2),
+            ("CLEAR_ALL", 0.2),
+            (f"LOAD_SEQ:{self.current_servo_id}:{seq_str}", 0.3),
+            (f"PLAY_SERVO:{self.current_servo_id}", 0)
+        ]
         
-        # Start playback
-        self.send_command(f"PLAY_SERVO:{self.current_servo_id}")
-        
-        # Start GUI animation
-        self._start_playback_animation(self._get_sequence_duration(sequence))
+        self._dispatch_play(commands, self._get_sequence_duration(sequence))
     
     def _play_all_servos(self):
         """Play all servo sequences on the hardware."""
@@ -396,35 +634,100 @@ class ServoMotionEditor:
         # Stop any existing playback
         self._stop_playback()
         
-        # Send commands to ESP
-        self.send_command("STOP")
-        time.sleep(0.2)
-        self.send_command("CLEAR_ALL")
-        time.sleep(0.2)
-        
+        commands = [("STOP", 0.2), ("CLEAR_ALL", 0.2)]
         max_duration = 0
         
         # Load all sequences
         for servo_id, sequence in self.all_sequences.items():
             if len(sequence) >= 2:
-                seq_str = self._format_sequence_for_serial(sequence)
-                self.send_command(f"LOAD_SEQ:{servo_id}:{seq_str}")
-                time.sleep(0.15)
+                seq_str = self._get_serial_string(servo_id)
+                commands.append((f"LOAD_SEQ:{servo_id}:{seq_str}", 0.15))
                 max_duration = max(max_duration, self._get_sequence_duration(sequence))
         
         # Start playback
-        self.send_command("PLAY_LOADED")
+        commands.append(("PLAY_LOADED", 0))
+        
+        self._dispatch_play(commands, max_duration)
+    
+    def _dispatch_play(self, commands, duration_ms):
+        """Send playback commands from a worker thread.
+        
+        The ESP32 needs a pause after each command, so sending them here
+        would freeze the editor. The animation starts back on the Tk thread
+        once the last command is out.
         
-        # Start GUI animation
-        self._start_playback_animation(max_duration)
+        Args:
+            commands: List of (command, delay in seconds after sending) pairs
+            duration_ms: Length of the playback animation
+        """
+        # Each dispatch gets its own stop event and queue, so a quick Stop then Play can't revive the old thread
+        stop_event = threading.Event()
+        command_queue = queue.Queue()
+        self.play_stop_event = stop_event
+        
+        # Only Stop is available while the sequence loads
+        self.play_current_btn.config(state="disabled")
+        self.play_all_btn.config(state="disabled")
+        self.stop_btn.config(state="normal")
+        
+        self.play_thread = threading.Thread(target=self._play_commands_thread,
+                                           args=(commands, command_queue, stop_event))
+        self.play_thread.daemon = True
+        self.play_thread.start()
+        self.window.after(PLAY_QUEUE_POLL_MS, self._pump_play_commands, command_queue, stop_event, duration_ms)
+    
+    def _play_commands_thread(self, commands, command_queue, stop_event):
+        """Worker thread: pace the commands onto the queue, stopping early if asked.
+        
+        Sending logs to the console widget, so the thread never calls
+        send_command itself; _pump_play_commands sends each command from the
+        Tk thread. None marks the end of the commands.
+        """
+        for command, delay in commands:
+            if stop_event.is_set():
+                return
+            command_queue.put(command)
+            if delay:
+                stop_event.wait(delay)
+        
+        command_queue.put(None)
+    
+    def _pump_play_commands(self, command_queue, stop_event, duration_ms):
+        """Send commands queued by the play thread, on the Tk thread."""
+        while not stop_event.is_set():
+            try:
+                command = command_queue.get_nowait()
+            except queue.Empty:
+                self.window.after(PLAY_QUEUE_POLL_MS, self._pump_play_commands,
+                                  command_queue, stop_event, duration_ms)
+                return
+            
+            if command is None:
+                self._on_play_commands_sent(duration_ms)
+                return
+            self.send_command(command)
+    
+    def _on_play_commands_sent(self, duration_ms):
+        """Start the playback animation once the hardware has been told to play."""
+        if duration_ms > 0:
+            self._start_playback_animation(duration_ms)
+        else:
+            self.play_current_btn.config(state="normal")
+            self.play_all_btn.config(state="normal")
+            self.stop_btn.config(state="disabled")
     
     def _stop_playback(self):
         """Stop playback on hardware and GUI."""
+        # Abort a sequence that is still being loaded
+        self.play_stop_event.set()
+        
         if self.playback_active:
             # Stop animation
             self.playback_active = False
+            self.blit_background = None
             if self.playback_line:
                 self.playback_line.set_visible(False)
+                self.playback_line.set_animated(False)
             self.canvas.draw_idle()
         
         # Update controls
@@ -443,13 +746,16 @@ class ServoMotionEditor:
             
         # Set up playback state
         self.playback_duration = duration_ms
-        self.playback_start_time = time.time()
+        self.playback_start_ns = time.monotonic_ns()
+        self.playback_drawn_ms = -PLAYBACK_MIN_REDRAW_MS
         self.playback_active = True
         
-        # Set up playback line
+        # Set up playback line; it is blitted on its own, so the full redraw leaves it out of the background
         if self.playback_line:
             self.playback_line.set_xdata([0])
             self.playback_line.set_visible(True)
+            self.playback_line.set_animated(True)
+            self.canvas.draw()
         
         # Update controls
         self.play_current_btn.config(state="disabled")
@@ -464,45 +770,113 @@ class ServoMotionEditor:
         if not self.playback_active:
             return
             
-        elapsed_s = time.time() - self.playback_start_time
-        elapsed_ms = elapsed_s * 1000
+        # Monotonic clock, so wall clock adjustments can't jump the line
+        elapsed_ms = (time.monotonic_ns() - self.playback_start_ns) / 1e6
         
         if elapsed_ms >= self.playback_duration:
             # Playback finished
             self._stop_playback()
         else:
-            # Update line position
-            if self.playback_line:
+            # Update line position, skipping ticks that bunch up after a slow draw
+            if self.playback_line and elapsed_ms - self.playback_drawn_ms >= PLAYBACK_MIN_REDRAW_MS:
                 self.playback_line.set_xdata([elapsed_ms])
-                self.canvas.draw_idle()
+                self._blit_animated()
+                self.playback_drawn_ms = elapsed_ms
             
             # Schedule next update
-            self.window.after(50, self._update_playback_animation)  # 20fps
+            self.window.after(PLAYBACK_TICK_MS, self._update_playback_animation)  # 20fps
+    
+    def _animated_artists(self):
+        """Artists currently left out of full draws and blitted instead, in z-order.
+        
+        The playback line is animated during playback, the data artists while
+        something is being dragged.
+        """
+        artists = (self.curve_collection, self.handle_collection, self.control_point_scatter,
+                   self.keyframe_scatter, self.playback_line)
+        return [artist for artist in artists if artist is not None and artist.get_animated()]
+    
+    def _blit_animated(self):
+        """Redraw only the animated artists over the cached axes background."""
+        if self.blit_background is None:
+            # Background not captured yet, a full draw captures it through _on_draw
+            self.canvas.draw()
+            return
+            
+        self.canvas.restore_region(self.blit_background)
+        for artist in self._animated_artists():
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.ax.bbox)
+    
+    def _on_draw(self, event):
+        """Recapture the blit background after every full redraw while anything is animated."""
+        animated = self._animated_artists()
+        if not animated:
+            return
+            
+        self.blit_background = self.canvas.copy_from_bbox(self.ax.bbox)
+        for artist in animated:
+            self.ax.draw_artist(artist)
+    
+    def _set_drag_animated(self, animated):
+        """Switch the data artists between blitted (while dragging) and normally drawn."""
+        for artist in (self.curve_collection, self.handle_collection,
+                       self.control_point_scatter, self.keyframe_scatter):
+            artist.set_animated(animated)
+        
+        # The background changes with the set of animated artists
+        self.blit_background = None
+        if animated:
+            self.canvas.draw()
+        else:
+            self.canvas.draw_idle()
     
     def _on_angle_entry(self, event=None):
-        """Handle changes to the angle entry field."""
+        """Handle changes to the angle entry field.
+        
+        Return and FocusOut usually fire back to back, so the edit is queued
+        and applied once when Tk is idle.
+        """
         if self.selected_kf_index is None:
             return
             
+        if self.pending_angle_entry is not None:
+            self.window.after_cancel(self.pending_angle_entry)
+        self.pending_angle_entry = self.window.after_idle(
+            self._apply_angle_entry, self.current_servo_id, self.selected_kf_index, self.angle_var.get())
+    
+    def _flush_angle_entry(self):
+        """Apply a queued angle entry edit now, before the keyframes change."""
+        if self.pending_angle_entry is not None:
+            self.window.after_cancel(self.pending_angle_entry)
+            self.pending_angle_entry = None
+            self._apply_angle_entry(self.current_servo_id, self.selected_kf_index, self.angle_var.get())
+    
+    def _apply_angle_entry(self, servo_id, kf_index, text):
+        """Set the angle of a keyframe from the entry text captured when it was queued."""
+        self.pending_angle_entry = None
+        is_selected = servo_id == self.current_servo_id and kf_index == self.selected_kf_index
+        
         try:
-            new_angle = round(max(0, min(180, float(self.angle_var.get()))))
-            sequence = self.get_current_sequence()
+            new_angle = round(max(0, min(180, float(text))))
+            sequence = self.all_sequences.get(servo_id, ServoTrack())
             
-            if self.selected_kf_index < len(sequence):
-                old_angle = sequence[self.selected_kf_index]['angle']
+            if kf_index is not None and kf_index < len(sequence):
+                old_angle = sequence.angles[kf_index]
                 if old_angle != new_angle:
-                    sequence[self.selected_kf_index]['angle'] = new_angle
+                    sequence.angles[kf_index] = new_angle
+                    self._mark_dirty(servo_id)
                     self.update_plot_for_current_servo()
-                    self.save_status = "Not Saved"
-                    self.status_label.config(text=f"Status: {self.save_status}")
+                    self._set_status("Not Saved")
                     
                     # NEW CODE: Send SA command to update servo position when changing angle value
                     if self.send_command:
-                        self.send_command(f"SA:{self.current_servo_id}:{int(new_angle)}")
+                        self.send_command(f"SA:{servo_id}:{int(new_angle)}")
                     
-                    # Update angle in entry
+                # Update angle in entry
+                if is_selected:
                     self.angle_var.set(str(new_angle))
-            else:
+            elif is_selected:
                 self.clear_selection()
         except ValueError:
             # Restore valid value
@@ -513,8 +887,7 @@ class ServoMotionEditor:
         if self.selected_kf_index is not None:
             sequence = self.get_current_sequence()
             if self.selected_kf_index < len(sequence):
-                kf = sequence[self.selected_kf_index]
-                self.angle_var.set(str(round(kf['angle'])))
+                self.angle_var.set(str(int(round(float(sequence.angles[self.selected_kf_index])))))
     
     def _add_keyframe(self):
         """Add a new keyframe to the current sequence."""
@@ -524,28 +897,26 @@ class ServoMotionEditor:
         if not sequence:
             x_min, x_max = self.ax.get_xlim()
             new_time = (x_min + x_max) / 2
-            new_kf = {'time': new_time, 'angle': 90, 'cp_in': None, 'cp_out': None}
-            sequence.append(new_kf)
         else:
             # Add keyframe after last one
-            last_kf = sequence[-1]
-            new_time = last_kf['time'] + 500  # 500ms after last keyframe
-            new_kf = {'time': new_time, 'angle': 90, 'cp_in': None, 'cp_out': None}
-            sequence.append(new_kf)
+            new_time = sequence.times[-1] + 500  # 500ms after last keyframe
         
-        # Sort by time
-        sequence.sort(key=lambda kf: kf['time'])
+        # The track keeps itself sorted by time
+        sequence.add(new_time, 90)
+        self._mark_dirty()
         
         # Update control points
         self.ensure_default_control_points(self.current_servo_id)
         
         # Update plot
         self.update_plot_for_current_servo()
-        self.save_status = "Not Saved"
-        self.status_label.config(text=f"Status: {self.save_status}")
+        self._set_status("Not Saved")
     
     def _remove_keyframe(self):
         """Remove the selected keyframe."""
+        # Apply a typed angle before indices shift
+        self._flush_angle_entry()
+        
         if self.selected_kf_index is None:
             messagebox.showinfo("Info", "No keyframe selected")
             return
@@ -558,6 +929,7 @@ class ServoMotionEditor:
         # Remove the keyframe
         if 0 <= self.selected_kf_index < len(sequence):
             sequence.pop(self.selected_kf_index)
+            self._mark_dirty()
             self.clear_selection()
             
             # Update control points
@@ -565,8 +937,7 @@ class ServoMotionEditor:
             
             # Update plot
             self.update_plot_for_current_servo()
-            self.save_status = "Not Saved"
-            self.status_label.config(text=f"Status: {self.save_status}")
+            self._set_status("Not Saved")
     
     def _on_close(self):
         """Handle window close event."""
@@ -581,6 +952,13 @@ class ServoMotionEditor:
                 self._save_all_servos()
         
         # Clean up any resources
+        self.play_stop_event.set()
+        if self.pending_angle_entry is not None:
+            self.window.after_cancel(self.pending_angle_entry)
+            self.pending_angle_entry = None
+        if self.status_pending is not None:
+            self.window.after_cancel(self.status_pending)
+            self.status_pending = None
         plt.close(self.fig)
         self.window.destroy()
         
@@ -593,44 +971,90 @@ class ServoMotionEditor:
     
     def get_current_sequence(self):
         """Get the keyframe sequence for the current servo."""
-        return self.all_sequences.get(self.current_servo_id, [])
+        return self.all_sequences.get(self.current_servo_id, ServoTrack())
+    
+    def find_keyframe_at(self, time_ms, servo_id=None):
+        """Return the index of the keyframe at exactly time_ms, or None."""
+        track = self.all_sequences.get(self.current_servo_id if servo_id is None else servo_id, ServoTrack())
+        times = track.times
+        idx = int(np.searchsorted(times, time_ms))
+        if idx < len(times) and times[idx] == time_ms:
+            return idx
+        return None
+    
+    def _hit_test_keyframe(self, event):
+        """Return the index of the keyframe under the mouse, or None.
+        
+        Only keyframes whose time falls within the pick radius are checked,
+        found with a binary search on the sorted keyframe times.
+        """
+        sequence = self.get_current_sequence()
+        times = sequence.times
+        if not len(times) or event.xdata is None:
+            return None
+        
+        # Convert the pick radius from pixels to a time window in data units
+        edge_time = self.ax.transData.inverted().transform((event.x + PICK_RADIUS_PX, event.y))[0]
+        half_window = abs(edge_time - event.xdata)
+        lo = int(np.searchsorted(times, event.xdata - half_window, side='left'))
+        hi = int(np.searchsorted(times, event.xdata + half_window, side='right'))
+        if lo >= hi:
+            return None
+        
+        # Compare the few candidates in display space, nearest one wins
+        points = np.column_stack((times[lo:hi], sequence.angles[lo:hi]))
+        offsets = self.ax.transData.transform(points) - (event.x, event.y)
+        dist_sq = np.einsum('ij,ij->i', offsets, offsets)
+        nearest = int(np.argmin(dist_sq))
+        if dist_sq[nearest] > PICK_RADIUS_PX ** 2:
+            return None
+        return lo + nearest
+    
+    def _hit_test_control_point(self, event):
+        """Return the index into control_point_keys of the control point under the mouse, or None.
+        
+        All control points are projected to display space in one transform and
+        the nearest one within the pick radius wins.
+        """
+        if not len(self.control_point_positions):
+            return None
+            
+        offsets = self.ax.transData.transform(self.control_point_positions) - (event.x, event.y)
+        dist_sq = np.einsum('ij,ij->i', offsets, offsets)
+        nearest = int(np.argmin(dist_sq))
+        if dist_sq[nearest] > PICK_RADIUS_PX ** 2:
+            return None
+        return nearest
     
     def ensure_default_control_points(self, servo_id):
-        """Ensure all keyframes have valid control points."""
+        """Ensure all keyframes have valid control points.
+        
+        Missing handles default to a third of the gap to the neighbouring
+        keyframe, filled in for the whole track with array operations.
+        """
         if servo_id not in self.all_sequences:
             return
             
-        sequence = self.all_sequences[servo_id]
-        num_keyframes = len(sequence)
-        
-        for i, kf in enumerate(sequence):
-            default_dt_factor = 0.33
-            
-            # Incoming control point (not for first keyframe)
-            if i > 0:
-                if 'cp_in' not in kf or kf['cp_in'] is None:
-                    prev_kf = sequence[i-1]
-                    time_diff = kf['time'] - prev_kf['time']
-                    dt = max(1, time_diff) * -default_dt_factor
-                    kf['cp_in'] = {'dt': dt, 'da': 0.0}
-                elif not isinstance(kf['cp_in'], dict):
-                    kf['cp_in'] = {'dt': 0.0, 'da': 0.0}
-            else:
-                # First keyframe has no incoming control point
-                kf['cp_in'] = None
-            
-            # Outgoing control point (not for last keyframe)
-            if i < num_keyframes - 1:
-                if 'cp_out' not in kf or kf['cp_out'] is None:
-                    next_kf = sequence[i+1]
-                    time_diff = next_kf['time'] - kf['time']
-                    dt = max(1, time_diff) * default_dt_factor
-                    kf['cp_out'] = {'dt': dt, 'da': 0.0}
-                elif not isinstance(kf['cp_out'], dict):
-                    kf['cp_out'] = {'dt': 0.0, 'da': 0.0}
-            else:
-                # Last keyframe has no outgoing control point
-                kf['cp_out'] = None
+        track = self.all_sequences[servo_id]
+        if not len(track):
+            return
+            
+        default_dt_factor = 0.33
+        gaps = np.maximum(1.0, np.diff(track.times))
+        
+        # Incoming control points (not for first keyframe)
+        missing_in = np.isnan(track.cp_in_dt[1:])
+        track.cp_in_dt[1:][missing_in] = -default_dt_factor * gaps[missing_in]
+        track.cp_in_da[1:][missing_in] = 0.0
+        
+        # Outgoing control points (not for last keyframe)
+        missing_out = np.isnan(track.cp_out_dt[:-1])
+        track.cp_out_dt[:-1][missing_out] = default_dt_factor * gaps[missing_out]
+        track.cp_out_da[:-1][missing_out] = 0.0
+        
+        # First keyframe has no incoming and last has no outgoing control point
+        track.cp_in_dt[0] = track.cp_in_da[0] = np.nan
+        track.cp_out_dt[-1] = track.cp_out_da[-1] = np.nan
     
     def setup_plot(self):
         """Set up the static plot elements."""
@@ -641,6 +1065,20 @@ class ServoMotionEditor:
         
         # Add playback line (initially invisible)
         self.playback_line = self.ax.axvline(0, color='orange', linestyle='--', lw=2, visible=False, zorder=20)
+        
+        # Persistent data artists, filled by update_plot_for_current_servo
+        self.keyframe_scatter = self.ax.scatter([], [], color="red", s=80, zorder=10, picker=5)
+        self.control_point_scatter = self.ax.scatter([], [], color='green', s=60, alpha=0.8, zorder=9, picker=5)
+        self.curve_collection = self.ax.add_collection(LineCollection([], colors='blue', linewidths=2, zorder=5))
+        self.handle_collection = self.ax.add_collection(
+            LineCollection([], colors='green', linestyles=':', alpha=0.7, zorder=8))
+        
+        # Legend is fixed, so build it once from proxy artists
+        self.ax.legend(handles=[
+            Line2D([], [], color='red', marker='o', ls='', label="Keyframes"),
+            Line2D([], [], color='blue', lw=2, label="Curve"),
+            Line2D([], [], color='green', marker='o', ls='', alpha=0.8, label="Control Point")
+        ], loc='best')
     
     def update_x_range(self, min_time, max_time=None):
         """Update the visible x-axis range."""
@@ -657,50 +1095,27 @@ class ServoMotionEditor:
         if kf_index >= len(sequence):
             return None
             
-        kf = sequence[kf_index]
-        cp_key = 'cp_' + cp_type
-        
-        if cp_key not in kf or kf[cp_key] is None:
+        dt, da = sequence.control_point_arrays(cp_type)
+        if np.isnan(dt[kf_index]):
             return None
             
-        cp_relative = kf[cp_key]
-        abs_time = kf['time'] + cp_relative['dt']
-        abs_angle = kf['angle'] + cp_relative['da']
+        abs_time = sequence.times[kf_index] + dt[kf_index]
+        abs_angle = sequence.angles[kf_index] + da[kf_index]
         abs_angle = max(0, min(180, abs_angle))  # Clamp
         
         return abs_time, abs_angle
     
-    def clear_plot_elements(self):
-        """Remove all dynamic plot elements."""
-        if self.keyframe_scatter and self.keyframe_scatter in self.ax.collections:
-            self.keyframe_scatter.remove()
-            self.keyframe_scatter = None
-            
-        for line in self.curve_segment_lines.values():
-            if line in self.ax.lines:
-                line.remove()
-        self.curve_segment_lines.clear()
-        
-        for point in self.control_point_scatter.values():
-            if point in self.ax.collections:
-                point.remove()
-        self.control_point_scatter.clear()
-        
-        for line in self.control_handle_lines.values():
-            if line in self.ax.lines:
-                line.remove()
-        self.control_handle_lines.clear()
-    
     def clear_selection(self):
         """Clear the current keyframe selection."""
         self.selected_kf_index = None
         self.angle_var.set("")
     
     def update_plot_for_current_servo(self):
-        """Update the plot to show the current servo's sequence."""
-        self.clear_plot_elements()
-        self.setup_plot()
+        """Update the plot to show the current servo's sequence.
         
+        Artists are created once in setup_plot and updated in place with
+        set_offsets/set_segments, so edits and drags don't rebuild the plot.
+        """
         sequence = self.get_current_sequence()
         
         # Handle selection and textbox update
@@ -711,66 +1126,24 @@ class ServoMotionEditor:
                 self._restore_angle_entry()
         
         if not sequence:
+            self.keyframe_scatter.set_offsets(np.empty((0, 2)))
+            self.control_point_scatter.set_offsets(np.empty((0, 2)))
+            self.control_point_keys = []
+            self.control_point_positions = np.empty((0, 2))
+            self.handle_collection.set_segments([])
+            self.curve_collection.set_segments([])
             if self.playback_line:
                 self.playback_line.set_visible(False)
             self.canvas.draw_idle()
             return
         
-        # Plot keyframes
-        keyframe_times = [int(round(kf['time'])) for kf in sequence]
-        keyframe_angles = [int(round(kf['angle'])) for kf in sequence]
-        self.keyframe_scatter = self.ax.scatter(
-            keyframe_times, keyframe_angles,
-            color="red", s=80, zorder=10, label="Keyframes", picker=5
-        )
+        self._update_data_artists(sequence)
         
-        # Plot curves, control points, and handles
-        num_keyframes = len(sequence)
-        curve_drawn, handle_label_drawn = False, False
-        
-        for i in range(num_keyframes):
-            kf_pos = (sequence[i]['time'], sequence[i]['angle'])
-            
-            # Incoming control point
-            if i > 0:
-                cp_in_abs = self.get_control_point_absolute_coords(i, 'in')
-                if cp_in_abs:
-                    self._draw_control_point_and_handle(i, 'in', kf_pos, cp_in_abs, not handle_label_drawn)
-                    handle_label_drawn = True
-            
-            # Outgoing control point
-            if i < num_keyframes - 1:
-                cp_out_abs = self.get_control_point_absolute_coords(i, 'out')
-                if cp_out_abs:
-                    self._draw_control_point_and_handle(i, 'out', kf_pos, cp_out_abs, not handle_label_drawn)
-                    handle_label_drawn = True
-            
-            # Curve segment
-            if i < num_keyframes - 1:
-                kf_next = sequence[i+1]
-                kf_next_pos = (kf_next['time'], kf_next['angle'])
-                cp_out_abs = self.get_control_point_absolute_coords(i, 'out')
-                cp_in_abs_next = self.get_control_point_absolute_coords(i + 1, 'in')
-                
-                if cp_out_abs and cp_in_abs_next:
-                    p0, p1, p2, p3 = kf_pos, cp_out_abs, cp_in_abs_next, kf_next_pos
-                    time_vals, angle_vals = self._compute_bezier_curve_segment(p0, p1, p2, p3)
-                    curve_label = "Curve" if not curve_drawn else None
-                    line, = self.ax.plot(time_vals, angle_vals, color='blue', lw=2, zorder=5, label=curve_label)
-                    self.curve_segment_lines[i] = line
-                    curve_drawn = True
-        
-        # Update legend
-        handles, labels = self.ax.get_legend_handles_labels()
-        if handles:
-            self.ax.legend(handles, labels, loc='best')
-        
-        # Adjust x-axis to fit content
-        if sequence:
-            min_time = min(kf['time'] for kf in sequence)
-            max_time = max(kf['time'] for kf in sequence)
-            padding = max(500, (max_time - min_time) * 0.1)
-            self.update_x_range(max(0, min_time - padding), max_time + padding)
+        # Adjust x-axis to fit content; keyframes are sorted so the ends give the range
+        min_time = sequence.times[0]
+        max_time = sequence.times[-1]
+        padding = max(500, (max_time - min_time) * 0.1)
+        self.update_x_range(max(0, min_time - padding), max_time + padding)
         
         # Make sure playback line is hidden if not active
         if not self.playback_active and self.playback_line:
@@ -778,44 +1151,83 @@ class ServoMotionEditor:
             
         self.canvas.draw_idle()
     
-    def _draw_control_point_and_handle(self, kf_index, cp_type, kf_pos, cp_abs_pos, add_label=False):
-        """Draw a control point and its handle line."""
-        key = (kf_index, cp_type)
-        handle_label = "Control Point" if add_label else None
-        
-        # Line
-        line = Line2D([kf_pos[0], cp_abs_pos[0]], [kf_pos[1], cp_abs_pos[1]],
-                      ls=':', color='green', alpha=0.7, zorder=8)
-        self.ax.add_line(line)
-        self.control_handle_lines[key] = line
-        
-        # Point
-        point = self.ax.scatter(cp_abs_pos[0], cp_abs_pos[1],
-                              color='green', s=60, alpha=0.8, zorder=9, picker=5, label=handle_label)
-        self.control_point_scatter[key] = point
-    
-    def _cubic_bezier_point(self, t, p0, p1, p2, p3):
-        """Compute a point on a cubic bezier curve."""
-        # Bernstein basis polynomials
-        b0 = (1 - t)**3
-        b1 = 3 * (1 - t)**2 * t
-        b2 = 3 * (1 - t) * t**2
-        b3 = t**3
-        
-        # Calculate point coordinates
-        time_val = b0 * p0[0] + b1 * p1[0] + b2 * p2[0] + b3 * p3[0]
-        angle_val = b0 * p0[1] + b1 * p1[1] + b2 * p2[1] + b3 * p3[1]
-        
-        return (time_val, angle_val)
-    
-    def _compute_bezier_curve_segment(self, p0, p1, p2, p3, num_points=100):
-        """Compute points along a cubic bezier curve segment."""
-        t_values = np.linspace(0, 1, num_points)
-        points = [self._cubic_bezier_point(t, p0, p1, p2, p3) for t in t_values]
-        
-        # Unzip points into time and angle arrays
-        time_values, angle_values = zip(*points) if points else ([], [])
-        return np.array(time_values), np.array(angle_values)
+    def _update_data_artists(self, sequence):
+        """Push a non-empty sequence's keyframes, control points and curves into the plot artists.
+        
+        Drags only need this part of update_plot_for_current_servo: keyframe
+        times never change while dragging, so the axes don't need refitting.
+        """
+        # Keyframes, straight from the track arrays; matplotlib takes float offsets as they are
+        kf_points = np.column_stack((sequence.times, sequence.angles))
+        self.keyframe_scatter.set_offsets(kf_points)
+        
+        # Control points and handles for both sides, gathered with masks over the track
+        cp_keys, cp_positions, handles = [], [], []
+        
+        for cp_type in ('in', 'out'):
+            cp_indices = np.flatnonzero(sequence.has_control_points(cp_type))
+            cp_abs = sequence.control_point_coords(cp_type)[cp_indices]
+            cp_keys.extend((int(i), cp_type) for i in cp_indices)
+            cp_positions.append(cp_abs)
+            handles.append(np.stack((kf_points[cp_indices], cp_abs), axis=1))
+        
+        self.control_point_keys = cp_keys
+        self.control_point_positions = np.concatenate(cp_positions)
+        self.control_point_scatter.set_offsets(self.control_point_positions)
+        
+        self.handle_collection.set_segments(np.concatenate(handles))
+        
+        # Curve segments, sampled for all segments in one batch
+        segment_indices = np.flatnonzero(sequence.has_control_points('out')[:-1]
+                                         & sequence.has_control_points('in')[1:])
+        
+        if len(segment_indices):
+            # (segments, points, 2) array, one polyline per segment
+            self.curve_collection.set_segments(
+                self._compute_bezier_segments(sequence, segment_indices, cache_key=self.current_servo_id))
+        else:
+            self.curve_collection.set_segments([])
+    
+    def _compute_bezier_segments(self, sequence, segment_indices, cache_key=None):
+        """Compute points along several cubic bezier curve segments at once.
+        
+        Segment i runs from keyframe i to keyframe i+1 using keyframe i's outgoing
+        and keyframe i+1's incoming control points.
+        
+        With a cache_key, the control polygons and samples are kept and only
+        segments whose control polygon changed since the last call are resampled,
+        so a drag only recomputes the one or two segments it touches.
+        
+        Returns:
+            Array of shape (len(segment_indices), BEZIER_SAMPLES, 2) holding (time, angle) samples
+        """
+        idx = np.asarray(segment_indices)
+        
+        # Control points for every segment, shape (segments, 2); handles are clamped like get_control_point_absolute_coords
+        p0 = np.column_stack((sequence.times[idx], sequence.angles[idx]))
+        p3 = np.column_stack((sequence.times[idx+1], sequence.angles[idx+1]))
+        p1 = sequence.control_point_coords('out')[idx]
+        p2 = sequence.control_point_coords('in')[idx+1]
+        
+        # (segments, 2, 4) control polygons sampled against the (4, samples) basis
+        control_polygons = np.ascontiguousarray(np.stack((p0, p1, p2, p3), axis=2), dtype=np.float64)
+        
+        cached = self.curve_cache.get(cache_key) if cache_key is not None else None
+        if cached is not None and cached[0].shape == control_polygons.shape:
+            cached_polygons, cached_samples = cached
+            changed = np.any(control_polygons != cached_polygons, axis=(1, 2))
+            if not changed.any():
+                return cached_samples
+                
+            # The curve collection's paths hold views of the old samples, so update a copy
+            samples = cached_samples.copy()
+            samples[changed] = _sample_bezier(np.ascontiguousarray(control_polygons[changed]), self.bezier_basis)
+        else:
+            samples = _sample_bezier(control_polygons, self.bezier_basis)
+        
+        if cache_key is not None:
+            self.curve_cache[cache_key] = (control_polygons, samples)
+        return samples
     
     # ---- Event Handling ----
     
@@ -824,6 +1236,7 @@ class ServoMotionEditor:
         self.fig.canvas.mpl_connect("button_press_event", self.on_press)
         self.fig.canvas.mpl_connect("button_release_event", self.on_release)
         self.fig.canvas.mpl_connect("motion_notify_event", self.on_motion)
+        self.fig.canvas.mpl_connect("draw_event", self._on_draw)
     
     def on_press(self, event):
         """Handle mouse press events."""
@@ -834,11 +1247,9 @@ class ServoMotionEditor:
         
         # Check control points first
         clicked_cp_key = None
-        for key, scatter_point in self.control_point_scatter.items():
-            cont, _ = scatter_point.contains(event)
-            if cont:
-                clicked_cp_key = key
-                break
+        cp_index = self._hit_test_control_point(event)
+        if cp_index is not None:
+            clicked_cp_key = self.control_point_keys[cp_index]
         
         if clicked_cp_key:
             element_selected = True
@@ -846,6 +1257,7 @@ class ServoMotionEditor:
             if kf_index < len(self.get_current_sequence()):
                 self.dragging_element = {'type': 'control_point', 'kf_index': kf_index, 'cp_type': cp_type}
                 self.clear_selection()
+                self._set_drag_animated(True)
                 return
             else:
                 self.dragging_element = None
@@ -868,20 +1280,20 @@ class ServoMotionEditor:
 
         #check keyframes ----- NEW:
         if self.keyframe_scatter:
-            cont, ind = self.keyframe_scatter.contains(event)
-            if cont:
+            kf_index = self._hit_test_keyframe(event)
+            if kf_index is not None:
                 element_selected = True
-                kf_index = ind["ind"][0]
                 if kf_index < len(self.get_current_sequence()):
                     self.dragging_element = {'type': 'keyframe', 'index': kf_index}
                     self.selected_kf_index = kf_index
                     self._restore_angle_entry()
                     
                     # NEW CODE: Send SA command to update servo position when selecting a keyframe
-                    current_angle = self.get_current_sequence()[kf_index]['angle']
-                    if self.send_command:
-                        self.send_command(f"SA:{self.current_servo_id}:{int(round(current_angle))}")
+                    current_angle = self.get_current_sequence().angles[kf_index]
+                    self.drag_sent_angle = None
+                    self._send_drag_angle(int(round(current_angle)), force=True)
                     
+                    self._set_drag_animated(True)
                     return
                 else:
                     self.dragging_element = None
@@ -894,7 +1306,33 @@ class ServoMotionEditor:
     def on_release(self, event):
         """Handle mouse release events."""
         if event.button == 1 and self.dragging_element:
+            # Make sure the servo ends on the released angle, even if the last move was throttled
+            if self.dragging_element['type'] == 'keyframe':
+                sequence = self.get_current_sequence()
+                kf_index = self.dragging_element['index']
+                if kf_index < len(sequence):
+                    self._send_drag_angle(int(round(sequence.angles[kf_index])), force=True)
+                    
             self.dragging_element = None
+            self._set_drag_animated(False)
+    
+    def _send_drag_angle(self, angle, force=False):
+        """Send the dragged keyframe's angle to the servo, at most every DRAG_SEND_INTERVAL_S.
+        
+        Motion events arrive far faster than the serial link needs, so moves
+        inside the interval are dropped; force skips the interval check. An
+        angle equal to the last one sent is never resent.
+        """
+        if not self.send_command or angle == self.drag_sent_angle:
+            return
+            
+        now = time.monotonic()
+        if not force and now - self.drag_sent_time < DRAG_SEND_INTERVAL_S:
+            return
+            
+        self.send_command(f"{self.sa_prefix}{angle:d}")
+        self.drag_sent_angle = angle
+        self.drag_sent_time = now
     
     def on_motion(self, event):
         """Handle mouse motion events."""
@@ -925,15 +1363,14 @@ class ServoMotionEditor:
             if kf_index < len(sequence):
                 # Only angle changes now (time fixed to keep order)
                 target_angle_rounded = round(current_angle_clamped)
-                old_angle = sequence[kf_index]['angle']
+                old_angle = sequence.angles[kf_index]
                 
                 if old_angle != target_angle_rounded:
-                    sequence[kf_index]['angle'] = target_angle_rounded
+                    sequence.angles[kf_index] = target_angle_rounded
                     needs_update = True
                     
                     # NEW CODE: Send SA command to update servo position during dragging
-                    if self.send_command:
-                        self.send_command(f"SA:{self.current_servo_id}:{int(target_angle_rounded)}")
+                    self._send_drag_angle(target_angle_rounded)
                     
                 # Update the textbox display in real-time
                 if self.selected_kf_index == kf_index:
@@ -943,13 +1380,12 @@ class ServoMotionEditor:
             kf_index = self.dragging_element['kf_index']
             if kf_index < len(sequence):
                 cp_type = self.dragging_element['cp_type']
-                cp_key = 'cp_' + cp_type
-                kf = sequence[kf_index]
+                cp_dt, cp_da = sequence.control_point_arrays(cp_type)
                 
-                if cp_key in kf and kf[cp_key] is not None:
+                if not np.isnan(cp_dt[kf_index]):
                     # Calculate relative dt/da based on target mouse position
-                    dt = current_time - kf['time']
-                    da = current_angle_clamped - kf['angle']
+                    dt = current_time - sequence.times[kf_index]
+                    da = current_angle_clamped - sequence.angles[kf_index]
                     
                     # Apply constraints - outgoing points must be after keyframe, incoming before
                     if cp_type == 'out':
@@ -958,13 +1394,14 @@ class ServoMotionEditor:
                         dt = min(-0.01, dt)
                     
                     # Update data structure if changed
-                    if sequence[kf_index][cp_key]['dt'] != dt or sequence[kf_index][cp_key]['da'] != da:
-                        sequence[kf_index][cp_key]['dt'] = dt
-                        sequence[kf_index][cp_key]['da'] = da
+                    if cp_dt[kf_index] != dt or cp_da[kf_index] != da:
+                        cp_dt[kf_index] = dt
+                        cp_da[kf_index] = da
                         needs_update = True
         
-        # Redraw plot if data changed
+        # Redraw only the data artists if data changed; the axes and selection are unaffected by a drag
         if needs_update:
-            self.update_plot_for_current_servo()
-            self.save_status = "Not Saved"
-            self.status_label.config(text=f"Status: {self.save_status}")
\ No newline at end of file
+            self._mark_dirty()
+            self._update_data_artists(sequence)
+            self._blit_animated()
+            self._set_status("Not Saved")
\ No newline at end of file
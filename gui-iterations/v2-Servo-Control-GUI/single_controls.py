@@ -1,7 +1,6 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from master_control import MasterControl
-import time
 
 class SingleControls:
     def __init__(self, parent, num_servos, send_command_callback=None):
@@ -12,6 +11,7 @@ class SingleControls:
         
         self.servo_controls = []
         self.servo_angles = []
+        self.pending_sends = {} #servo_id -> after id of the coalesced slider send, one per servo so servos don't throttle each other
         
         #frame display
         self.individual_frame = ttk.LabelFrame(self.frame, text="Individual Servo Controls")
@@ -119,17 +119,16 @@ class SingleControls:
 # -----------------------------------------------------------------------
 # event handlers
 # -----------------------------------------------------------------------
-    def _on_slider_changed(self, servo_id): #send individual command when individual servo angle is moved
-        # angle = self.servo_angles[servo_id].get()
+    def _on_slider_changed(self, servo_id): #slider fires on every pixel of a drag, so schedule one send per 50ms window instead of sending each event
+        if servo_id not in self.pending_sends:
+            self.pending_sends[servo_id] = self.frame.after(50, self._send_servo_angle, servo_id)
+    
+    def _send_servo_angle(self, servo_id): #send whatever angle the servo ended up on when the window closes, so the final drag position is never dropped
+        self.pending_sends.pop(servo_id, None)
+        angle = self.servo_angles[servo_id].get()
         
-        current_time = time.time()
-        if not hasattr(self, '_last_command_time') or (current_time - self._last_command_time) > 0.05:  #50ms throttle
-            angle = self.servo_angles[servo_id].get()
-
-            if self.send_command:
-                result = self.send_command(f"SA:{servo_id}:{angle}")
-                if result:
-                    self.last_command_time = current_time
+        if self.send_command:
+            self.send_command(f"SA:{servo_id}:{angle}")
     
     def _on_angle_entry(self, servo_id, event=None): #exact samne as master control just diff argument and serial command.. could also potentially make them both into a reusable function to reduce code
             control = self.servo_controls[servo_id]
@@ -177,19 +176,14 @@ class SingleControls:
             control["angle_var"].set(current - 1)
             self._on_slider_changed(servo_id)
     
-    def _handle_master_command(self, command): #handle master command to initialise master control callback
-        if command.startswith("MA:"):
-            try:
-                angle = int(command.split(":")[1])
-                
-                for i in range(self.num_servos): #update all individual servos
-                    self.servo_angles[i].set(angle)
+    def _handle_master_command(self, angle, command): #handle master command to initialise master control callback; angle comes as an int so the pre-encoded command is sent as is
+        for i in range(self.num_servos): #update all individual servos
+            self.servo_angles[i].set(angle)
+        
+        if self.send_command:
+            return self.send_command(command) #pass the send result back so master control knows it went out
                 
-                if self.send_command:
-                    self.send_command(command)
-                    
-            except (ValueError, IndexError):
-                pass
+        return False
     
 # -----------------------------------------------------------------------
 # similar concept to the master control public method~ to set angle without sending serial command; currently not used
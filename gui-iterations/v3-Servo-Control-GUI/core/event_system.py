@@ -3,11 +3,14 @@ from collections import defaultdict
 class EventSystem:
     #reliable event management with direct callbacks
     def __init__(self):
-        #event_type -> list of callback functions
-        self.subscribers = defaultdict(list)
+        #event_type -> ordered set of callback functions (dict keys, values unused) for O(1) add/remove
+        self.subscribers = defaultdict(dict)
         
         #component_name -> list of (callback, event_types)
         self.component_subscribers = defaultdict(list)
+        
+        #(event_type, callback) -> component the callback was registered for, so publish can look up the filter directly
+        self._component_filters = {}
     
     #register callback for specific event types
     def subscribe(self, event_types, callback):
@@ -15,8 +18,7 @@ class EventSystem:
             event_types = [event_types]
         
         for event_type in event_types:
-            if callback not in self.subscribers[event_type]:
-                self.subscribers[event_type].append(callback)
+            self.subscribers[event_type][callback] = None
     
     #register callback for specific component events
     def subscribe_component(self, component_name, event_types, callback):
@@ -28,12 +30,13 @@ class EventSystem:
         
         #also add to main subscribers for delivery
         for event_type in event_types:
-            if callback not in self.subscribers[event_type]:
-                self.subscribers[event_type].append(callback)
+            self._component_filters.setdefault((event_type, callback), component_name)
+            self.subscribers[event_type][callback] = None
     
     #publish event to all relevant subscribers
     def publish(self, event_type, *args, **kwargs):
-        if event_type not in self.subscribers:
+        subs = self.subscribers.get(event_type)
+        if not subs:
             return
         
         #extract component context from event args
@@ -42,29 +45,22 @@ class EventSystem:
             if isinstance(args[0], str):
                 component_name = args[0]
         
+        #only filter when the event names a component and something is component-specific; most events skip this
+        filter_components = bool(component_name) and bool(self._component_filters)
+        
         #deliver to all subscribers
         dead_callbacks = []
         
-        for callback in self.subscribers[event_type]:
+        #iterate a snapshot so callbacks that subscribe/unsubscribe don't mutate the list mid-loop
+        for callback in list(subs):
             try:
-                #check if this callback needs component filtering
-                should_deliver = True
-                
-                if component_name:
-                    #check if callback is component-specific
-                    is_component_specific = False
-                    for comp_name, callback_list in self.component_subscribers.items():
-                        for stored_callback, event_types in callback_list:
-                            if stored_callback == callback and event_type in event_types:
-                                if comp_name != component_name:
-                                    should_deliver = False
-                                is_component_specific = True
-                                break
-                        if is_component_specific:
-                            break
+                #skip component-specific callbacks that belong to a different component
+                if filter_components:
+                    owner = self._component_filters.get((event_type, callback))
+                    if owner is not None and owner != component_name:
+                        continue
                 
-                if should_deliver:
-                    callback(event_type, *args, **kwargs)
+                callback(event_type, *args, **kwargs)
                     
             except Exception as e:
                 #remove failed callbacks
@@ -78,8 +74,8 @@ class EventSystem:
     def unsubscribe(self, callback):
         #remove from main subscribers
         for event_type in list(self.subscribers.keys()):
-            if callback in self.subscribers[event_type]:
-                self.subscribers[event_type].remove(callback)
+            self.subscribers[event_type].pop(callback, None)
+            self._component_filters.pop((event_type, callback), None)
             
             #clean up empty lists
             if not self.subscribers[event_type]:
@@ -114,6 +110,7 @@ class EventSystem:
     def cleanup(self):
         self.subscribers.clear()
         self.component_subscribers.clear()
+        self._component_filters.clear()
 
 #global event system instance
 _event_system = EventSystem()
@@ -19,6 +19,10 @@ class ServoState:
         if config_data:
             self._load_config_data(config_data)
         
+        #servo index to component name lookup, kept in sync with index changes
+        self.component_by_index = {}
+        self._rebuild_index_lookup()
+        
         #system state
         self.num_servos = MAX_SERVOS
         self.pwm_freq = PWM_FREQUENCY
@@ -54,6 +58,12 @@ class ServoState:
                     default_config.update(loaded_config)
                     self.servo_configurations[component_name] = default_config
     
+    #rebuild servo index lookup, first component wins on duplicate indices
+    def _rebuild_index_lookup(self):
+        self.component_by_index = {}
+        for component_name, config in self.servo_configurations.items():
+            self.component_by_index.setdefault(config["index"], component_name)
+    
     #set sequence manager reference
     def set_sequence_manager(self, sequence_manager):
         self.sequence_manager = sequence_manager
@@ -93,6 +103,9 @@ class ServoState:
             config_data = self.servo_configurations.pop(old_name)
             self.servo_configurations[new_name] = config_data
             
+            if self.component_by_index.get(config_data["index"]) == old_name:
+                self.component_by_index[config_data["index"]] = new_name
+            
             #update component groups lists (order authority)
             for group_name, components in self.component_groups.items():
                 if old_name in components:
@@ -110,6 +123,8 @@ class ServoState:
                 config_data = self.servo_configurations.pop(new_name)
                 self.servo_configurations[old_name] = config_data
             
+            self._rebuild_index_lookup()
+            
             for group_name, components in self.component_groups.items():
                 if new_name in components:
                     index = components.index(new_name)
@@ -132,6 +147,9 @@ class ServoState:
         
         config[setting] = value
         
+        if setting == "index":
+            self._rebuild_index_lookup()
+        
         #publish event immediately
         publish(Events.COMPONENT_SETTING_CHANGED, component_name, setting, value, component_name=component_name)
         
@@ -193,6 +211,11 @@ class ServoState:
         #perform the swap
         config1["index"], config2["index"] = config2["index"], config1["index"]
         
+        if self.component_by_index.get(config1["index"]) == component2:
+            self.component_by_index[config1["index"]] = component1
+        if self.component_by_index.get(config2["index"]) == component1:
+            self.component_by_index[config2["index"]] = component2
+        
         #publish event immediately for both components
         publish(Events.COMPONENT_INDEX_SWAPPED, component1, component2)
         
@@ -235,10 +258,10 @@ class ServoState:
     
     #get servo config by index
     def get_servo_config_by_index(self, servo_index):
-        for component_name, config in self.servo_configurations.items():
-            if config["index"] == servo_index:
-                return component_name, config
-        return None, None
+        component_name = self.component_by_index.get(servo_index)
+        if component_name is None:
+            return None, None
+        return component_name, self.servo_configurations[component_name]
     
     #get current positions using component groups order
     def get_current_component_positions(self):
@@ -21,6 +21,9 @@ DEFAULT_KEYFRAME_DELAY = 1.0
 SLIDER_THROTTLE_MS = 50 #controls how fast the slider sends pulse width values; only used for the slider
 PLAYBACK_COMMAND_INTERVAL = 0.005
 PLAYBACK_TIMING_PRECISION = 0.01
+PLAYBACK_UI_PUMP_MS = 16 #how often playback log/status updates are applied on the tk thread
+TIMELINE_RESIZE_DEBOUNCE_MS = 100 #timeline redraws once resize events stop for this long
+CONSOLE_FLUSH_MS = 50 #console log lines are batched and written at most this often
 
 #command terminal
 COMMAND_HISTORY_LIMIT = 10
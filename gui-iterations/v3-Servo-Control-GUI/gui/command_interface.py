@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext
-from core.validation import COMMAND_HISTORY_LIMIT
+from collections import deque
+from core.validation import COMMAND_HISTORY_LIMIT, CONSOLE_FLUSH_MS
 
 #simplified command templates for terminal interface
 COMMAND_TEMPLATES = {
@@ -111,6 +112,7 @@ class CommandTerminal:
         self.command_history = []
         self.history_index = -1
         self.autocomplete_cache = []
+        self.help_window = None  #built on first use, then hidden and shown again instead of rebuilt
         
         #gui variables
         self.command_var = tk.StringVar()
@@ -420,7 +422,7 @@ class CommandTerminal:
         try:
             target_pulse = int(float(value_str))
             success_count = 0
-            command_count = 0
+            servo_positions = []
             total_components = len(self.state.servo_configurations)
             clamped_components = 0
             
@@ -433,13 +435,11 @@ class CommandTerminal:
                 
                 if self.state.update_servo_position(component_name, clamped_pulse):
                     success_count += 1
-                    
-                    if self.serial_connection.is_connected:
-                        servo_index = config["index"]
-                        if self.serial_connection.send_command(f"SP:{servo_index}:{clamped_pulse}"):
-                            command_count += 1
+                    servo_positions.append((config["index"], clamped_pulse))
             
             if self.serial_connection.is_connected:
+                #send all clamped positions in one frame
+                command_count = self.serial_connection.send_servo_positions(servo_positions)
                 self.log_callback(f"moved {success_count}/{total_components} components (sent {command_count} commands)")
             else:
                 self.log_callback(f"moved {success_count}/{total_components} components (not connected)")
@@ -457,7 +457,7 @@ class CommandTerminal:
         else:
             success = self.serial_connection.connect()
             if success:
-                self.log_callback("connected to serial port successfully")
+                self.log_callback("serial port opened, waiting for esp to respond")
             else:
                 self.log_callback("failed to connect to serial port")
     
@@ -483,11 +483,7 @@ class CommandTerminal:
         reset_commands = self.state.reset_all_servos_to_defaults()
         
         if self.serial_connection.is_connected:
-            success_count = 0
-            for servo_index, pulse_width in reset_commands:
-                if self.serial_connection.send_command(f"SP:{servo_index}:{pulse_width}"):
-                    success_count += 1
-            
+            success_count = self.serial_connection.send_servo_positions(reset_commands)
             self.log_callback(f"reset {success_count}/{len(reset_commands)} servos to default positions")
         else:
             self.log_callback(f"reset {len(reset_commands)} servos to default positions (not connected)")
@@ -592,12 +588,19 @@ class CommandTerminal:
         current_tool = self.content_switcher.get_selected_content()
         self.log_callback(f"current tool: {current_tool}")
     
-    #show detailed help window
+    #show detailed help window, reusing the one built earlier since its text never changes
     def _show_help(self):
+        if self.help_window is not None:
+            self.help_window.deiconify()
+            self.help_window.lift()
+            return
+        
         help_window = tk.Toplevel(self.frame)
         help_window.title("command terminal help")
         help_window.geometry("600x500")
         help_window.resizable(True, True)
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
+        self.help_window = help_window
         
         help_text = scrolledtext.ScrolledText(help_window, wrap=tk.WORD, padx=10, pady=10)
         help_text.pack(fill="both", expand=True)
@@ -648,8 +651,9 @@ class ConsoleLogger:
     #console logging widget
     def __init__(self, parent):
         self.frame = ttk.LabelFrame(parent, text="console log")
-        self.pending_messages = []
+        self.pending_messages = deque()
         self.console_ready = False
+        self.flush_after_id = None  #pending messages are written in one batch when this fires
         
         self._create_console()
     
@@ -667,21 +671,23 @@ class ConsoleLogger:
         self.console_ready = True
         self._process_pending_messages()
     
-    #log message to console
+    #log message to console, messages logged close together are written in a single batch
     def log_message(self, message):
-        if self.console_ready:
-            self.console.config(state=tk.NORMAL)
-            self.console.insert(tk.END, f"{message}\n")
-            self.console.see(tk.END)
-            self.console.config(state=tk.DISABLED)
-        else:
-            self.pending_messages.append(message)
+        self.pending_messages.append(message)
+        
+        if self.console_ready and self.flush_after_id is None:
+            self.flush_after_id = self.frame.after(CONSOLE_FLUSH_MS, self._process_pending_messages)
     
-    #process pending messages
+    #process pending messages with one insert for the whole batch
     def _process_pending_messages(self):
-        for message in self.pending_messages:
-            self.console.config(state=tk.NORMAL)
-            self.console.insert(tk.END, f"{message}\n")
-            self.console.see(tk.END)
-            self.console.config(state=tk.DISABLED)
-        self.pending_messages.clear()
\ No newline at end of file
+        self.flush_after_id = None
+        if not self.pending_messages:
+            return
+        
+        batch = "".join(f"{message}\n" for message in self.pending_messages)
+        self.pending_messages.clear()
+        
+        self.console.config(state=tk.NORMAL)
+        self.console.insert(tk.END, batch)
+        self.console.see(tk.END)
+        self.console.config(state=tk.DISABLED)
\ No newline at end of file
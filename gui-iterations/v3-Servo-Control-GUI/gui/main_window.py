@@ -28,6 +28,9 @@ class ContentSwitcher:
         #eye display components
         self.eye_display_widget = None
         
+        #placeholder frames are built once and re-packed on each switch
+        self.placeholder_frames = {}
+        
         self._create_ui()
     
     #set dependencies for sequence recording
@@ -75,10 +78,8 @@ class ContentSwitcher:
         if self.eye_display_widget and self.eye_display_widget.is_visible():
             self.eye_display_widget.hide()
         
-        for widget in self.content_container.winfo_children():
-            if (widget != getattr(self.sequence_recorder_widget, 'frame', None) and 
-                widget != getattr(self.eye_display_widget, 'frame', None)):
-                widget.destroy()
+        for placeholder_frame in self.placeholder_frames.values():
+            placeholder_frame.pack_forget()
     
     #create content frame based on selection
     def _create_content_frame(self):
@@ -134,8 +135,14 @@ class ContentSwitcher:
         self._create_placeholder("TBI: unknown tool", "gray")
     
     def _create_placeholder(self, main_text, colour, detail_text=None):
+        #reuse an existing placeholder instead of rebuilding its widgets
+        if main_text in self.placeholder_frames:
+            self.placeholder_frames[main_text].pack(expand=True, fill="both")
+            return
+        
         placeholder_frame = ttk.Frame(self.content_container)
         placeholder_frame.pack(expand=True, fill="both")
+        self.placeholder_frames[main_text] = placeholder_frame
         
         center_frame = ttk.Frame(placeholder_frame)
         center_frame.pack(expand=True, fill="both")
@@ -232,7 +239,8 @@ class ServoControlGUI:
         self.servo_controls = ServoControlsManager(
             content_frame, 
             self.state, 
-            self.serial_connection.send_command
+            self.serial_connection.send_command,
+            self.serial_connection.send_servo_positions
         )
         self.servo_controls.frame.grid(row=0, column=0, sticky="nw", padx=(0, 10))
         
@@ -307,12 +315,11 @@ class ServoControlGUI:
     def _on_window_close(self):
         self._log_message("shutting down servo control system...")
         
-        #stop sequence playback if active
-        if self.content_switcher.is_sequence_recording_active():
-            sequence_widget = self.content_switcher.get_sequence_recorder_widget()
-            if sequence_widget and hasattr(sequence_widget, 'playback_manager'):
-                sequence_widget.playback_manager.stop_playback()
-                self._log_message("stopped sequence playback")
+        #stop sequence playback even if the recorder tool is not the one shown
+        sequence_widget = self.content_switcher.get_sequence_recorder_widget()
+        if sequence_widget and sequence_widget.playback_manager.is_playing():
+            sequence_widget.playback_manager.stop_playback()
+            self._log_message("stopped sequence playback")
         
         #cleanup eye display and facial tracking if active
         if hasattr(self.content_switcher, 'eye_display_widget') and self.content_switcher.eye_display_widget:
@@ -1,14 +1,81 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import tkinter.font as tkfont
 import json
 import time
+import queue
 import threading
+from collections import Counter
+from itertools import islice
+import numpy as np
 from core.validation import (
     MAX_SEQUENCE_DURATION, MIN_KEYFRAME_INTERVAL, MAX_KEYFRAME_DELAY, 
-    DEFAULT_KEYFRAME_DELAY, PLAYBACK_COMMAND_INTERVAL, PLAYBACK_TIMING_PRECISION,
+    DEFAULT_KEYFRAME_DELAY, PLAYBACK_UI_PUMP_MS, TIMELINE_RESIZE_DEBOUNCE_MS,
     validate_timing, validate_component_positions
 )
 from core.event_system import subscribe, publish, Events
+from hardware.servo_config import MAX_SERVOS, SERIAL_DRAIN_INTERVAL
+
+#orjson is optional, it parses and writes large sequences several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+#write data as indented json, using orjson when available
+def _write_json_file(file_path, data):
+    if orjson:
+        with open(file_path, 'wb') as file:
+            file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, 'w') as file:
+            json.dump(data, file, indent=2)
+
+#read json data, using orjson when available
+def _read_json_file(file_path):
+    if orjson:
+        with open(file_path, 'rb') as file:
+            return orjson.loads(file.read())
+    with open(file_path, 'r') as file:
+        return json.load(file)
+
+#numba is optional, it compiles the playback delta scan into a single pass over the position matrix
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+#mark servos whose pulse width differs from the last one sent, array version used without numba
+def _changed_position_mask_vectorised(positions):
+    is_set = positions >= 0
+    
+    #forward fill each servo column so every row holds the last pulse width sent before it
+    row_numbers = np.arange(positions.shape[0])[:, None]
+    last_set_row = np.maximum.accumulate(np.where(is_set, row_numbers, -1), axis=0)
+    sent_positions = np.where(last_set_row >= 0, np.take_along_axis(positions, np.maximum(last_set_row, 0), axis=0), -1)
+    previous_positions = np.vstack([np.full((1, positions.shape[1]), -1, dtype=positions.dtype), sent_positions[:-1]])
+    
+    return is_set & (positions != previous_positions)
+
+#same mask as a scalar loop, compiled by numba so it runs without temporary arrays
+def _changed_position_mask_scan(positions):
+    step_count, servo_count = positions.shape
+    changed = np.zeros((step_count, servo_count), dtype=np.bool_)
+    
+    for column in range(servo_count):
+        last_sent = -1
+        for row in range(step_count):
+            pulse_width = positions[row, column]
+            if pulse_width >= 0 and pulse_width != last_sent:
+                changed[row, column] = True
+                last_sent = pulse_width
+    
+    return changed
+
+if njit:
+    _changed_position_mask = njit(cache=True)(_changed_position_mask_scan)
+else:
+    _changed_position_mask = _changed_position_mask_vectorised
 
 class SequenceManager:
     #manages sequence data and operations
@@ -24,6 +91,7 @@ class SequenceManager:
             "keyframes": []
         }
         self.dirty_timing_from_index = None
+        self.component_usage = Counter()  #keyframes using each component, kept in sync on every edit
         self.gui_callbacks = []  #direct callbacks for reliability
     
     #add gui callback for updates
@@ -73,6 +141,7 @@ class SequenceManager:
         }
         
         self.sequence_data["keyframes"].append(keyframe)
+        self.component_usage.update(component_positions.keys())
         self.sequence_data["metadata"]["total_keyframes"] = len(self.sequence_data["keyframes"])
         self.sequence_data["metadata"]["component_count"] = len(component_positions)
         
@@ -90,7 +159,9 @@ class SequenceManager:
         if len(self.sequence_data["keyframes"]) <= 1:
             return False, "cannot remove the only keyframe, use clear instead"
         
-        self.sequence_data["keyframes"].pop(index)
+        removed_keyframe = self.sequence_data["keyframes"].pop(index)
+        self.component_usage.subtract(removed_keyframe["component_positions"].keys())
+        self.component_usage += Counter()  #drop components no keyframe uses anymore
         
         #mark timing dirty from removal point
         self.dirty_timing_from_index = index
@@ -137,15 +208,24 @@ class SequenceManager:
             self.dirty_timing_from_index = None
             return
         
-        #recalculate from dirty index forward
-        for i in range(self.dirty_timing_from_index, len(keyframes)):
-            if i == 0:
-                keyframes[i]["absolute_time"] = 0.0
-            else:
-                prev_keyframe = keyframes[i-1]
-                keyframes[i]["absolute_time"] = round(
-                    prev_keyframe["absolute_time"] + prev_keyframe["delay_to_next"], 3
-                )
+        #recalculate from dirty index forward, start times are a cumulative sum of the preceding delays
+        start_index = self.dirty_timing_from_index
+        first_summed = max(start_index, 1)
+        keyframe_count = len(keyframes)
+        
+        absolute_times = np.empty(keyframe_count - start_index, dtype=np.float64)
+        if start_index == 0:
+            absolute_times[0] = 0.0
+        
+        base_time = keyframes[first_summed - 1]["absolute_time"] if start_index > 0 else 0.0
+        delays = np.fromiter(
+            (keyframes[i]["delay_to_next"] for i in range(first_summed - 1, keyframe_count - 1)),
+            dtype=np.float64, count=keyframe_count - first_summed
+        )
+        absolute_times[first_summed - start_index:] = base_time + np.cumsum(delays)
+        
+        for keyframe, absolute_time in zip(keyframes[start_index:], absolute_times.tolist()):
+            keyframe["absolute_time"] = round(absolute_time, 3)
         
         self.dirty_timing_from_index = None
     
@@ -160,6 +240,7 @@ class SequenceManager:
     #clear entire sequence
     def clear_sequence(self):
         self.sequence_data["keyframes"].clear()
+        self.component_usage.clear()
         self.sequence_data["metadata"]["total_keyframes"] = 0
         self.sequence_data["metadata"]["creation_timestamp"] = None
         self.sequence_data["metadata"]["component_count"] = 0
@@ -191,26 +272,51 @@ class SequenceManager:
         return last_keyframe["absolute_time"] + last_keyframe["delay_to_next"]
     
     def get_sequence_components(self):
-        components = set()
-        for keyframe in self.sequence_data["keyframes"]:
-            components.update(keyframe["component_positions"].keys())
-        return sorted(list(components))
+        return sorted(self.component_usage)
     
-    #resolve component positions to servo commands
-    def resolve_keyframe_to_commands(self, keyframe):
+    #recount component usage after the keyframe list is replaced
+    def _rebuild_component_usage(self):
+        self.component_usage = Counter(
+            component_name for keyframe in self.sequence_data["keyframes"] for component_name in keyframe["component_positions"]
+        )
+    
+    #resolve component positions to (servo index, pulse width) pairs
+    def resolve_keyframe_to_positions(self, keyframe):
         if "component_positions" not in keyframe:
             return [], []
         
-        commands = []
+        servo_positions = []
         missing_components = []
         
         for component_name, pulse_width in keyframe["component_positions"].items():
             if component_name in self.state.servo_configurations:
                 servo_index = self.state.servo_configurations[component_name]["index"]
-                commands.append(f"SP:{servo_index}:{pulse_width}")
+                servo_positions.append((servo_index, pulse_width))
             else:
                 missing_components.append(component_name)
         
+        return servo_positions, missing_components
+    
+    #resolve keyframes to a steps x servos pulse width matrix, -1 marks servos a step does not set
+    def build_position_matrix(self, keyframes):
+        index_by_component = {name: config["index"] for name, config in self.state.servo_configurations.items()}
+        servo_indices = sorted({index_by_component[name] for keyframe in keyframes
+                                for name in keyframe.get("component_positions", {}) if name in index_by_component})
+        column_by_index = {servo_index: column for column, servo_index in enumerate(servo_indices)}
+        
+        positions = np.full((len(keyframes), len(servo_indices)), -1, dtype=np.int32)
+        for row, keyframe in enumerate(keyframes):
+            for component_name, pulse_width in keyframe.get("component_positions", {}).items():
+                servo_index = index_by_component.get(component_name)
+                if servo_index is not None:
+                    positions[row, column_by_index[servo_index]] = pulse_width
+        
+        return np.array(servo_indices, dtype=np.int32), positions
+    
+    #resolve component positions to servo commands
+    def resolve_keyframe_to_commands(self, keyframe):
+        servo_positions, missing_components = self.resolve_keyframe_to_positions(keyframe)
+        commands = [f"SP:{servo_index}:{pulse_width}" for servo_index, pulse_width in servo_positions]
         return commands, missing_components
     
     #validate sequence integrity
@@ -261,8 +367,7 @@ class SequenceManager:
                     "pulse_max": config["pulse_max"]
                 }
             
-            with open(file_path, 'w') as file:
-                json.dump(save_data, file, indent=2)
+            _write_json_file(file_path, save_data)
             
             return True, f"sequence saved to {file_path}"
             
@@ -281,26 +386,35 @@ class SequenceManager:
             return False, "no file selected"
         
         try:
-            with open(file_path, 'r') as file:
-                loaded_data = json.load(file)
+            loaded_data = _read_json_file(file_path)
             
             if "keyframes" not in loaded_data or "metadata" not in loaded_data:
                 return False, "invalid sequence file format"
             
-            #validate keyframes
+            #validate keyframes and note the first component missing from the current configuration
+            servo_configurations = self.state.servo_configurations
+            unknown_component = None
+            
             for i, keyframe in enumerate(loaded_data["keyframes"]):
                 required_keys = ["absolute_time", "component_positions", "delay_to_next"]
                 if not all(key in keyframe for key in required_keys):
                     return False, f"invalid keyframe {i} format"
+                
+                if unknown_component is None:
+                    unknown_component = next((name for name in keyframe["component_positions"] if name not in servo_configurations), None)
             
             self.sequence_data["keyframes"] = loaded_data["keyframes"]
             self.sequence_data["metadata"].update(loaded_data["metadata"])
+            self._rebuild_component_usage()
             
             #recalculate timing to ensure consistency
             self.dirty_timing_from_index = 0
             self._recalculate_timing_from_dirty()
             
             self._notify_gui(Events.SEQUENCE_LOADED)
+            
+            if unknown_component is not None:
+                return True, f"sequence loaded from {file_path} (component '{unknown_component}' is not in the current configuration and will be skipped)"
             return True, f"sequence loaded from {file_path}"
             
         except Exception as e:
@@ -317,7 +431,10 @@ class PlaybackManager:
         
         self.is_playing_flag = False
         self.playback_thread = None
-        self.stop_requested = False
+        self.stop_event = threading.Event() #stop event of the latest run, each run gets its own
+        
+        #playback must finish before the serial port is closed underneath it
+        self.serial_connection.add_disconnect_callback(self.stop_playback)
     
     #check playback status
     def is_playing(self):
@@ -334,26 +451,33 @@ class PlaybackManager:
         if not self.serial_connection.is_connected:
             return False, "serial connection required"
         
-        self.stop_requested = False
-        self.playback_thread = threading.Thread(target=self._playback_thread, daemon=True)
+        #a fresh event per run, so a thread that outlived stop_playback's join can't be revived by clearing a shared one
+        stop_event = threading.Event()
+        self.stop_event = stop_event
+        self.is_playing_flag = True
+        self.playback_thread = threading.Thread(target=self._playback_thread, args=(stop_event,), daemon=True)
         self.playback_thread.start()
         
         return True, "playback started"
     
-    #stop sequence playback
+    #stop sequence playback and wait for the playback thread to exit
     def stop_playback(self):
-        if self.is_playing_flag:
-            self.stop_requested = True
-            
-            if self.playback_thread and self.playback_thread.is_alive():
-                self.playback_thread.join(timeout=1.0)
+        if not self.is_playing_flag:
+            return
+        
+        self.stop_event.set()
         
-        self._reset_playback_state()
+        playback_thread = self.playback_thread
+        if playback_thread and playback_thread.is_alive() and playback_thread is not threading.current_thread():
+            playback_thread.join(timeout=1.0)
+        
+        #the playback thread resets state on exit, only reset here if it did not finish in time
+        if self.is_playing_flag:
+            self._reset_playback_state()
     
     #reset playback state
     def _reset_playback_state(self):
         self.is_playing_flag = False
-        self.stop_requested = False
         self.playback_thread = None
         self._notify_gui("playback_stopped")
     
@@ -367,9 +491,11 @@ class PlaybackManager:
                     self.log_callback(f"gui callback error: {str(e)}")
     
     #main playback thread
-    def _playback_thread(self):
+    def _playback_thread(self, stop_event):
+        #per-send logging is replaced by one line per step while playing
+        self.serial_connection.verbose_logging = False
+        
         try:
-            self.is_playing_flag = True
             self._notify_gui("playback_started")
             
             keyframes = self.sequence_manager.get_keyframes()
@@ -379,7 +505,7 @@ class PlaybackManager:
                 components_used = self.sequence_manager.get_sequence_components()
                 self.log_callback(f"starting playback: {len(components_used)} components, {total_duration:.1f}s duration")
             
-            self._execute_sequence_playback(keyframes, total_duration)
+            self._execute_sequence_playback(keyframes, total_duration, stop_event)
             
             if self.log_callback:
                 self.log_callback("sequence playback completed")
@@ -391,66 +517,109 @@ class PlaybackManager:
             self._notify_gui("playback_error", error_msg)
             
         finally:
-            self._reset_playback_state()
+            #a run that was abandoned by stop_playback must not reset the state of a newer run
+            if self.stop_event is stop_event:
+                self.serial_connection.verbose_logging = True
+                self._reset_playback_state()
     
-    #execute sequence with precise timing
-    def _execute_sequence_playback(self, keyframes, total_duration):
-        playback_start_time = time.time()
-        current_keyframe_index = 0
+    #execute sequence with precise timing, sleeping until each keyframe deadline
+    def _execute_sequence_playback(self, keyframes, total_duration, stop_event):
+        if not keyframes:
+            return
+        
+        #resolve all steps before timing starts
+        step_frames = self._build_step_frames(keyframes)
+        playback_start_time = time.monotonic()
         
         #move to first keyframe immediately
-        if keyframes:
-            commands, missing = self.sequence_manager.resolve_keyframe_to_commands(keyframes[0])
-            self.serial_connection.send_batch_commands(commands, PLAYBACK_COMMAND_INTERVAL)
-            if self.log_callback:
-                self.log_callback(f"moved to initial position (step 1)")
-        
-        #main playback loop
-        while current_keyframe_index < len(keyframes) and not self.stop_requested:
-            current_time = time.time()
-            elapsed_seconds = current_time - playback_start_time
-            
-            #find current keyframe based on elapsed time
-            target_keyframe_index = self._find_current_keyframe(keyframes, elapsed_seconds)
-            
-            #advance to new keyframe if needed
-            if target_keyframe_index > current_keyframe_index:
-                for step_index in range(current_keyframe_index + 1, target_keyframe_index + 1):
-                    if step_index < len(keyframes) and not self.stop_requested:
-                        commands, missing = self.sequence_manager.resolve_keyframe_to_commands(keyframes[step_index])
-                        self.serial_connection.send_batch_commands(commands, PLAYBACK_COMMAND_INTERVAL)
-                        if self.log_callback:
-                            self.log_callback(f"executing step {step_index + 1}")
-                
-                current_keyframe_index = target_keyframe_index
+        self._send_step_frame(step_frames[0])
+        if self.log_callback:
+            self.log_callback(f"moved to initial position (step 1)")
+        
+        #main playback loop, each step starts when the previous one ends
+        for step_index in range(1, len(keyframes)):
+            previous_keyframe = keyframes[step_index - 1]
+            step_start_time = previous_keyframe["absolute_time"] + previous_keyframe["delay_to_next"]
+            
+            if self._wait_until(playback_start_time + step_start_time, stop_event):
+                return
             
-            #check completion
-            if elapsed_seconds >= total_duration:
+            self._send_step_frame(step_frames[step_index])
+            if self.log_callback:
+                self.log_callback(f"executing step {step_index + 1}")
+        
+        #hold the final keyframe for its delay
+        self._wait_until(playback_start_time + total_duration, stop_event)
+    
+    #block until a monotonic deadline, returns true if stop was requested first
+    def _wait_until(self, deadline, stop_event):
+        #keep pushing queued serial bytes out while waiting instead of leaving them for the next step
+        while self.serial_connection.has_pending_writes():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if stop_event.wait(min(remaining, SERIAL_DRAIN_INTERVAL)):
+                return True
+            if not self.serial_connection.flush_pending_writes():
                 break
+        
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            return stop_event.wait(remaining)
+        return stop_event.is_set()
+    
+    #resolve keyframes to (changed positions, broadcast pulse) pairs, first step sends every servo
+    def _build_step_frames(self, keyframes):
+        servo_indices, positions = self.sequence_manager.build_position_matrix(keyframes)
+        is_set = positions >= 0
+        
+        #only servos whose pulse width differs from the previous step are sent
+        changed = _changed_position_mask(positions)
+        
+        #broadcast is only valid when a step sets every servo to one pulse width
+        covers_all_servos = servo_indices.tolist() == list(range(MAX_SERVOS))
+        uniform_rows = is_set.all(axis=1) & (positions == positions[:, :1]).all(axis=1)
+        
+        step_frames = []
+        for row in range(len(keyframes)):
+            columns = np.flatnonzero(changed[row])
+            changed_positions = list(zip(servo_indices[columns].tolist(), positions[row, columns].tolist()))
+            
+            broadcast_pulse = None
+            if covers_all_servos and uniform_rows[row]:
+                broadcast_pulse = int(positions[row, 0])
             
-            time.sleep(PLAYBACK_TIMING_PRECISION)
+            step_frames.append((changed_positions, broadcast_pulse))
+        
+        return step_frames
     
-    #find current keyframe based on elapsed time
-    def _find_current_keyframe(self, keyframes, elapsed_seconds):
-        for i, keyframe in enumerate(keyframes):
-            keyframe_end_time = keyframe["absolute_time"] + keyframe["delay_to_next"]
-            if elapsed_seconds < keyframe_end_time:
-                return i
-        return len(keyframes) - 1
+    #send one step, using a single broadcast when several servos move to the same pulse width
+    def _send_step_frame(self, step_frame):
+        changed_positions, broadcast_pulse = step_frame
+        
+        if not changed_positions:
+            return
+        
+        if broadcast_pulse is not None and len(changed_positions) > 1:
+            self.serial_connection.send_broadcast_position(broadcast_pulse)
+        else:
+            self.serial_connection.send_servo_positions(changed_positions)
     
-    #preview keyframe commands
-    def preview_keyframe_commands(self, keyframe_index):
+    #preview keyframe positions
+    def preview_keyframe_positions(self, keyframe_index):
         keyframes = self.sequence_manager.get_keyframes()
         
         if not (0 <= keyframe_index < len(keyframes)):
             return [], ["invalid keyframe index"]
         
         keyframe = keyframes[keyframe_index]
-        return self.sequence_manager.resolve_keyframe_to_commands(keyframe)
+        return self.sequence_manager.resolve_keyframe_to_positions(keyframe)
 
 
 class TimelineVisualiser:
     #timeline visualisation for sequence
+    KEYFRAME_COLOURS = ("#2196F3", "#4CAF50", "#FF9800", "#9C27B0", "#F44336", "#607D8B", "#795548", "#009688")
+    
     def __init__(self, parent, max_duration=120.0, height=40):
         self.frame = ttk.Frame(parent)
         self.max_duration = max_duration
@@ -462,6 +631,14 @@ class TimelineVisualiser:
         self.animation_start_time = 0.0
         self.animation_duration = 0.0
         self.playback_line_id = None
+        self.static_layer_size = None  #canvas size the background and markers were last drawn for
+        self.sequence_signature = None  #timing the sequence layer was last drawn for
+        self.resize_after_id = None
+        self.canvas_size = (1, 1)  #tracked from configure events so drawing doesn't query tk for it
+        
+        #sequence layer items are kept and moved rather than deleted and recreated on each update
+        self.duration_bar_id = None
+        self.keyframe_item_ids = []  #(block id, label id) per drawn keyframe slot
         
         self._create_timeline()
     
@@ -475,62 +652,102 @@ class TimelineVisualiser:
             bd=1
         )
         self.canvas.pack(fill="x", padx=5, pady=2)
+        
+        #named fonts are resolved by tk once instead of on every text item
+        self.marker_font = tkfont.Font(self.canvas, family="Arial", size=8)
+        self.keyframe_font = tkfont.Font(self.canvas, family="Arial", size=8, weight="bold")
         self.canvas.bind("<Configure>", self._on_canvas_resize)
         self._draw_timeline()
     
-    #handle canvas resize
+    #handle canvas resize, a window drag fires many configure events so redraw once it settles
     def _on_canvas_resize(self, event):
+        self.canvas_size = (event.width, event.height)
+        if self.resize_after_id is not None:
+            self.canvas.after_cancel(self.resize_after_id)
+        self.resize_after_id = self.canvas.after(TIMELINE_RESIZE_DEBOUNCE_MS, self._on_resize_settled)
+    
+    #redraw the full timeline for the new canvas size
+    def _on_resize_settled(self):
+        self.resize_after_id = None
         self._draw_timeline()
     
-    #update sequence data
+    #update sequence data, only the sequence layer is redrawn when the canvas size is unchanged
     def update_sequence(self, keyframes, total_duration):
         self.keyframes = keyframes.copy() if keyframes else []
         self.total_duration = total_duration
-        self._draw_timeline()
+        
+        canvas_size = self.canvas_size
+        if canvas_size != self.static_layer_size:
+            self._draw_timeline()
+        elif self._get_sequence_signature() != self.sequence_signature:
+            self._draw_sequence_layer(*canvas_size)
+    
+    #the timeline only shows keyframe timing, so position-only edits leave it unchanged
+    def _get_sequence_signature(self):
+        return self.total_duration, tuple((keyframe["absolute_time"], keyframe["delay_to_next"]) for keyframe in self.keyframes)
     
     #draw complete timeline
     def _draw_timeline(self):
         if not self.canvas:
             return
         
-        self.canvas.delete("all")
+        self.canvas.delete("static")
+        self.static_layer_size = None
         
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
+        canvas_width, canvas_height = self.canvas_size
         
         if canvas_width <= 1 or canvas_height <= 1:
             return
         
         self._draw_background(canvas_width, canvas_height)
         self._draw_time_markers(canvas_width, canvas_height)
-        self._draw_keyframes(canvas_width, canvas_height)
+        self.canvas.tag_lower("static")
+        self.static_layer_size = (canvas_width, canvas_height)
+        
+        self._draw_sequence_layer(canvas_width, canvas_height)
         
         if self.is_animating and self.playback_line_id:
             self._update_playback_line()
     
+    #redraw only the items that depend on the sequence, leaving background and markers in place
+    def _draw_sequence_layer(self, width, height):
+        self._draw_duration_indicator(width, height)
+        self._draw_keyframes(width, height)
+        self.sequence_signature = self._get_sequence_signature()
+        
+        if self.playback_line_id:
+            self.canvas.tag_raise(self.playback_line_id)
+    
     #draw timeline background
     def _draw_background(self, width, height):
         #background
-        self.canvas.create_rectangle(0, 0, width, height, fill="#f8f8f8", outline="#cccccc")
+        self.canvas.create_rectangle(0, 0, width, height, fill="#f8f8f8", outline="#cccccc", tags="static")
         
         #main track
         track_y = height // 2
         track_height = 6
         self.canvas.create_rectangle(
             10, track_y - track_height//2, width - 10, track_y + track_height//2,
-            fill="#e0e0e0", outline="#cccccc"
+            fill="#e0e0e0", outline="#cccccc", tags="static"
         )
+    
+    #draw the filled part of the track covering the sequence duration
+    def _draw_duration_indicator(self, width, height):
+        if self.duration_bar_id is None:
+            self.duration_bar_id = self.canvas.create_rectangle(0, 0, 0, 0, fill="#4CAF50", outline="", tags="sequence")
         
-        #duration indicator
+        duration_width = 0
         if self.max_duration > 0:
             duration_ratio = min(1.0, self.total_duration / self.max_duration)
             duration_width = int((width - 20) * duration_ratio)
-            
-            if duration_width > 0:
-                self.canvas.create_rectangle(
-                    10, track_y - track_height//2, 10 + duration_width, track_y + track_height//2,
-                    fill="#4CAF50", outline=""
-                )
+        
+        if duration_width > 0:
+            track_y = height // 2
+            track_height = 6
+            self.canvas.coords(self.duration_bar_id, 10, track_y - track_height//2, 10 + duration_width, track_y + track_height//2)
+            self.canvas.itemconfigure(self.duration_bar_id, state="normal")
+        else:
+            self.canvas.itemconfigure(self.duration_bar_id, state="hidden")
     
     #draw time markers
     def _draw_time_markers(self, width, height):
@@ -544,54 +761,88 @@ class TimelineVisualiser:
             x_pos = 10 + int((current_time / self.max_duration) * (width - 20))
             
             #marker line
-            self.canvas.create_line(x_pos, height - 15, x_pos, height - 5, fill="#666666", width=1)
+            self.canvas.create_line(x_pos, height - 15, x_pos, height - 5, fill="#666666", width=1, tags="static")
             
             #time label
             if current_time == 0 or current_time % (marker_interval * 2) == 0:
                 time_text = f"{current_time:.0f}s"
-                self.canvas.create_text(x_pos, height - 18, text=time_text, font=("Arial", 8), 
-                                      fill="#666666", anchor="s")
+                self.canvas.create_text(x_pos, height - 18, text=time_text, font=self.marker_font, 
+                                      fill="#666666", anchor="s", tags="static")
             
             current_time += marker_interval
     
     #draw keyframe indicators
     def _draw_keyframes(self, width, height):
-        if not self.keyframes or self.max_duration <= 0:
-            return
+        used_slots = 0
         
-        track_y = height // 2
-        keyframe_height = 12
-        timeline_width = width - 20
-        min_keyframe_width = 4
-        
-        colours = ["#2196F3", "#4CAF50", "#FF9800", "#9C27B0", "#F44336", "#607D8B", "#795548", "#009688"]
-        
-        for i, keyframe in enumerate(self.keyframes):
-            start_time = keyframe["absolute_time"]
-            duration = keyframe["delay_to_next"]
+        if self.keyframes and self.max_duration > 0:
+            track_y = height // 2
+            keyframe_height = 12
             
-            start_ratio = start_time / self.max_duration
-            duration_ratio = duration / self.max_duration
+            colours = self.KEYFRAME_COLOURS
+            colour_count = len(colours)
+            canvas = self.canvas
             
-            start_x = 10 + int(start_ratio * timeline_width)
-            duration_width = max(min_keyframe_width, int(duration_ratio * timeline_width))
-            end_x = min(width - 10, start_x + duration_width)
+            block_starts, block_ends = self._compute_keyframe_extents(width)
+            visible = self._get_visible_keyframes(block_starts, block_ends)
             
-            if end_x > start_x:
-                keyframe_colour = colours[i % len(colours)]
+            for i in np.flatnonzero(visible).tolist():
+                start_x = int(block_starts[i])
+                end_x = int(block_ends[i])
+                
+                block_id, label_id = self._get_keyframe_items(used_slots)
+                used_slots += 1
                 
                 #keyframe block
-                self.canvas.create_rectangle(
-                    start_x, track_y - keyframe_height//2, 
-                    end_x, track_y + keyframe_height//2,
-                    fill=keyframe_colour, outline="#333333", width=1
-                )
+                canvas.coords(block_id, start_x, track_y - keyframe_height//2, end_x, track_y + keyframe_height//2)
+                canvas.itemconfigure(block_id, fill=colours[i % colour_count], state="normal")
                 
                 #keyframe number
                 if (end_x - start_x) >= 15:
-                    label_x = start_x + (end_x - start_x) // 2
-                    self.canvas.create_text(label_x, track_y, text=str(i + 1), font=("Arial", 8, "bold"), 
-                                          fill="white", anchor="center")
+                    canvas.coords(label_id, start_x + (end_x - start_x) // 2, track_y)
+                    canvas.itemconfigure(label_id, text=str(i + 1), state="normal")
+                else:
+                    canvas.itemconfigure(label_id, state="hidden")
+        
+        #hide slots left over from a longer sequence
+        for block_id, label_id in self.keyframe_item_ids[used_slots:]:
+            self.canvas.itemconfigure(block_id, state="hidden")
+            self.canvas.itemconfigure(label_id, state="hidden")
+    
+    #get the block and label items for a keyframe slot, creating them the first time the slot is used
+    def _get_keyframe_items(self, slot):
+        if slot < len(self.keyframe_item_ids):
+            return self.keyframe_item_ids[slot]
+        
+        block_id = self.canvas.create_rectangle(0, 0, 0, 0, outline="#333333", width=1, tags="sequence")
+        label_id = self.canvas.create_text(0, 0, font=self.keyframe_font, fill="white", anchor="center", tags="sequence")
+        self.keyframe_item_ids.append((block_id, label_id))
+        return block_id, label_id
+    
+    #cull blocks that would be drawn over completely, keyframes shorter than a pixel pile up at one x position
+    def _get_visible_keyframes(self, block_starts, block_ends):
+        visible = block_ends > block_starts
+        
+        #a later block starting on the same pixel and reaching at least as far hides the earlier one
+        covered_by_next = (block_starts[1:] == block_starts[:-1]) & (block_ends[1:] >= block_ends[:-1])
+        visible[:-1] &= ~covered_by_next
+        
+        return visible
+    
+    #compute pixel extents of every keyframe block in one pass over the whole sequence
+    def _compute_keyframe_extents(self, width):
+        keyframe_count = len(self.keyframes)
+        timeline_width = width - 20
+        min_keyframe_width = 4
+        
+        start_times = np.fromiter((keyframe["absolute_time"] for keyframe in self.keyframes), dtype=np.float64, count=keyframe_count)
+        durations = np.fromiter((keyframe["delay_to_next"] for keyframe in self.keyframes), dtype=np.float64, count=keyframe_count)
+        
+        start_x = 10 + (start_times / self.max_duration * timeline_width).astype(np.int64)
+        duration_width = np.maximum(min_keyframe_width, (durations / self.max_duration * timeline_width).astype(np.int64))
+        end_x = np.minimum(width - 10, start_x + duration_width)
+        
+        return start_x, end_x
     
     #start playback animation
     def start_playback_animation(self, duration):
@@ -603,7 +854,7 @@ class TimelineVisualiser:
         self.animation_duration = duration
         
         self.playback_line_id = self.canvas.create_line(
-            0, 0, 0, self.canvas.winfo_height(),
+            0, 0, 0, self.canvas_size[1],
             fill="#FF5722", width=2
         )
         
@@ -638,8 +889,7 @@ class TimelineVisualiser:
         if elapsed_seconds is None:
             elapsed_seconds = time.time() - self.animation_start_time
         
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
+        canvas_width, canvas_height = self.canvas_size
         
         if canvas_width <= 1 or self.max_duration <= 0:
             return
@@ -663,12 +913,20 @@ class SequenceRecorderWidget:
         self.delay_var = tk.DoubleVar(value=DEFAULT_KEYFRAME_DELAY)
         self.selected_step_index = None
         
+        #sequence events within one event loop iteration share a single display refresh
+        self.display_refresh_id = None
+        self.displayed_rows = None  #rows currently in the step tree
+        
+        #playback updates are queued by the playback thread and applied on the tk thread
+        self.playback_ui_queue = queue.Queue()
+        self.playback_pump_id = None
+        
         #playback manager
         self.playback_manager = PlaybackManager(
             sequence_manager=sequence_manager,
             serial_connection=serial_connection,
-            log_callback=log_callback,
-            gui_callback=self._on_playback_event
+            log_callback=self._queue_playback_log,
+            gui_callback=self._queue_playback_event
         )
         
         self._create_ui()
@@ -796,12 +1054,51 @@ class SequenceRecorderWidget:
             return
         
         success, message = self.playback_manager.start_playback()
-        if not success:
+        if success:
+            self._start_playback_pump()
+        else:
             messagebox.showerror("playback error", message)
     
     #stop playback
     def _stop_playback(self):
         self.playback_manager.stop_playback()
+        self._pump_playback_queue()
+    
+    #queue playback log messages for the tk thread
+    def _queue_playback_log(self, message):
+        self.playback_ui_queue.put(("log", message))
+    
+    #queue playback events for the tk thread
+    def _queue_playback_event(self, event_type, *args):
+        self.playback_ui_queue.put(("event", event_type, args))
+    
+    #schedule the next drain of the playback queue
+    def _start_playback_pump(self):
+        if self.playback_pump_id is None:
+            self.playback_pump_id = self.frame.after(PLAYBACK_UI_PUMP_MS, self._pump_playback_queue)
+    
+    #apply all queued playback updates in one pass, keeps running until the stop event is applied
+    def _pump_playback_queue(self):
+        if self.playback_pump_id is not None:
+            self.frame.after_cancel(self.playback_pump_id)
+            self.playback_pump_id = None
+        
+        playback_finished = False
+        while True:
+            try:
+                item = self.playback_ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            if item[0] == "log":
+                self.log_callback(item[1])
+            else:
+                self._on_playback_event(item[1], *item[2])
+                if item[1] == "playback_stopped":
+                    playback_finished = True
+        
+        if self.playback_manager.is_playing() or not playback_finished:
+            self._start_playback_pump()
     
     #clear sequence
     def _clear_sequence(self):
@@ -906,17 +1203,23 @@ class SequenceRecorderWidget:
             messagebox.showwarning("not connected", "serial connection required for preview")
             return
         
-        commands, missing = self.playback_manager.preview_keyframe_commands(self.selected_step_index)
+        servo_positions, missing = self.playback_manager.preview_keyframe_positions(self.selected_step_index)
         
         if missing:
             messagebox.showwarning("missing components", f"components not found: {', '.join(missing)}")
         
-        if commands:
-            success_count = self.serial_connection.send_batch_commands(commands)
-            self.log_callback(f"previewed step {self.selected_step_index + 1}: sent {success_count}/{len(commands)} commands")
+        if servo_positions:
+            success_count = self.serial_connection.send_servo_positions(servo_positions)
+            self.log_callback(f"previewed step {self.selected_step_index + 1}: sent {success_count}/{len(servo_positions)} positions")
     
-    #handle sequence events with forced refresh
+    #handle sequence events by scheduling one refresh once tk is idle
     def _on_sequence_event(self, event_type, *args):
+        if self.display_refresh_id is None:
+            self.display_refresh_id = self.frame.after_idle(self._flush_display_refresh)
+    
+    #apply the coalesced refresh
+    def _flush_display_refresh(self):
+        self.display_refresh_id = None
         self._update_all_displays()
     
     #handle playback events
@@ -941,28 +1244,36 @@ class SequenceRecorderWidget:
     
     #update sequence display
     def _update_sequence_display(self):
-        #clear existing items
-        for item in self.step_tree.get_children():
-            self.step_tree.delete(item)
-        
-        keyframes = self.sequence_manager.get_keyframes()
-        
-        for i, keyframe in enumerate(keyframes):
+        #build every row before touching tk so the tree is only modified in one burst
+        rows = []
+        for i, keyframe in enumerate(self.sequence_manager.get_keyframes()):
             component_positions = keyframe["component_positions"]
             component_count = len(component_positions)
             
-            if component_count <= 3:
-                component_summary = ", ".join([f"{name}:{val}" for name, val in list(component_positions.items())[:3]])
-            else:
-                items = list(component_positions.items())[:2]
-                component_summary = ", ".join([f"{name}:{val}" for name, val in items]) + f", ... ({component_count} total)"
+            #only the shown entries are formatted, the rest of the positions dict is never copied
+            shown_count = component_count if component_count <= 3 else 2
+            component_summary = ", ".join(f"{name}:{val}" for name, val in islice(component_positions.items(), shown_count))
+            if component_count > 3:
+                component_summary += f", ... ({component_count} total)"
             
-            self.step_tree.insert("", "end", values=(
+            rows.append((
                 i + 1,
                 f"{keyframe['absolute_time']:.1f}",
                 f"{keyframe['delay_to_next']:.1f}",
                 component_summary
             ))
+        
+        #nothing to do when the tree already shows these rows
+        if rows == self.displayed_rows:
+            return
+        self.displayed_rows = rows
+        
+        #clear existing items with a single delete call
+        self.step_tree.delete(*self.step_tree.get_children())
+        
+        insert = self.step_tree.insert
+        for row in rows:
+            insert("", "end", values=row)
     
     #update timeline
     def _update_timeline(self):
@@ -1005,5 +1316,10 @@ class SequenceRecorderWidget:
     
     #cleanup when widget is destroyed
     def __del__(self):
+        if getattr(self, 'display_refresh_id', None) is not None:
+            try:
+                self.frame.after_cancel(self.display_refresh_id)
+            except tk.TclError:
+                pass
         if hasattr(self, 'sequence_manager'):
             self.sequence_manager.remove_gui_callback(self._on_sequence_event)
\ No newline at end of file
@@ -1,8 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import time
 from core.validation import validate_pulse_width, validate_servo_index, SLIDER_THROTTLE_MS
-from core.event_system import subscribe_component, subscribe, Events
+from core.event_system import subscribe_component, subscribe, unsubscribe, Events
 
 class ServoControlWidget:
     #individual servo control widget with simplified rename functionality
@@ -11,7 +10,13 @@ class ServoControlWidget:
         self.state = state
         self.send_command = send_command_callback
         self.rename_callback = rename_callback
-        self.last_command_time = 0
+        
+        #throttled slider state (after id of pending send and latest value)
+        self.slider_after_id = None
+        self.pending_pulse_width = None
+        
+        #position events are synced to the tk variable once per idle
+        self.display_sync_id = None
         
         #get component configuration from lookup table
         self.config = state.get_component_config(component_name)
@@ -114,6 +119,13 @@ class ServoControlWidget:
         self.index_entry.bind("<Return>", self._on_index_entry)
         self.index_entry.bind("<FocusOut>", self._on_index_entry)
     
+    #stop timers and event delivery, then destroy the widget frame
+    def destroy(self):
+        self.cancel_pending_update()
+        unsubscribe(self._on_component_event)
+        unsubscribe(self._on_index_swap)
+        self.frame.destroy()
+    
     #handle component rename operation using simplified state manager approach
     def _on_rename_entry(self, event=None):
         new_name = self.component_name_var.get().strip()
@@ -135,14 +147,57 @@ class ServoControlWidget:
             messagebox.showerror("rename error", message)
             self.component_name_var.set(old_name)
     
-    #handle slider changes with throttling
+    #handle slider changes with throttling, latest value is sent once per throttle window
     def _on_slider_changed(self, value):
-        current_time = time.time()
-        if (current_time - self.last_command_time) * 1000 > SLIDER_THROTTLE_MS:
-            pulse_width = int(float(value))
-            self.pulse_width_var.set(pulse_width)
+        pulse_width = int(float(value))
+        self._set_displayed_pulse_width(pulse_width)
+        self.pending_pulse_width = pulse_width
+        
+        if self.slider_after_id is None:
+            self.slider_after_id = self.frame.after(SLIDER_THROTTLE_MS, self._flush_slider_update)
+    
+    #send the most recent slider value on the tk main thread
+    def _flush_slider_update(self):
+        self.slider_after_id = None
+        
+        if self.pending_pulse_width is not None:
+            pulse_width = self.pending_pulse_width
+            self.pending_pulse_width = None
             self._send_servo_command(pulse_width)
-            self.last_command_time = current_time
+    
+    #cancel any pending throttled slider send
+    def cancel_pending_update(self):
+        if self.slider_after_id is not None:
+            self.frame.after_cancel(self.slider_after_id)
+            self.slider_after_id = None
+        self.pending_pulse_width = None
+        
+        if self.display_sync_id is not None:
+            self.frame.after_cancel(self.display_sync_id)
+            self.display_sync_id = None
+    
+    #read the pulse width currently shown, the entry can also write the variable so no separate copy is kept
+    def _get_displayed_pulse_width(self):
+        try:
+            return self.pulse_width_var.get()
+        except tk.TclError:
+            return None #entry holds text that isn't a number
+    
+    #push a pulse width to the tk variable only when it differs from what is shown
+    def _set_displayed_pulse_width(self, pulse_width):
+        if pulse_width != self._get_displayed_pulse_width():
+            self.pulse_width_var.set(pulse_width)
+    
+    #coalesce position events into one tk variable update per idle cycle
+    def _schedule_position_sync(self):
+        if self.display_sync_id is None:
+            self.display_sync_id = self.frame.after_idle(self._sync_position_display)
+    
+    #apply the latest state position unless the user is mid-drag
+    def _sync_position_display(self):
+        self.display_sync_id = None
+        if self.pending_pulse_width is None:
+            self._set_displayed_pulse_width(self.config["current_position"])
     
     #handle current pulse width entry
     def _on_current_entry(self, event=None):
@@ -164,7 +219,7 @@ class ServoControlWidget:
             self._reset_current_entry()
             return
         
-        self.pulse_width_var.set(pulse_width)
+        self._set_displayed_pulse_width(pulse_width)
         self._send_servo_command(pulse_width)
     
     #handle pulse range entry changes
@@ -224,11 +279,7 @@ class ServoControlWidget:
             return
         
         #find component with target index for swapping using lookup
-        target_component = None
-        for comp_name, comp_config in self.state.servo_configurations.items():
-            if comp_config["index"] == new_index:
-                target_component = comp_name
-                break
+        target_component, _ = self.state.get_servo_config_by_index(new_index)
         
         if target_component:
             self.state.swap_component_indices(self.component_name, target_component)
@@ -244,7 +295,7 @@ class ServoControlWidget:
     #reset servo to default position
     def reset_to_default(self):
         default_pos = self.config["default_position"]
-        self.pulse_width_var.set(default_pos)
+        self._set_displayed_pulse_width(default_pos)
         self._send_servo_command(default_pos)
     
     #update slider range
@@ -254,14 +305,14 @@ class ServoControlWidget:
         self.max_label.config(text=str(self.config["pulse_max"]))
         
         #ensure current position is within new range
-        current = self.pulse_width_var.get()
-        if not (self.config["pulse_min"] <= current <= self.config["pulse_max"]):
-            self.pulse_width_var.set(self.config["current_position"])
+        current = self._get_displayed_pulse_width()
+        if current is None or not (self.config["pulse_min"] <= current <= self.config["pulse_max"]):
+            self._set_displayed_pulse_width(self.config["current_position"])
     
     #refresh all display values using lookup
     def _refresh_all_displays(self):
         #update all gui variables from current state lookup
-        self.pulse_width_var.set(self.config["current_position"])
+        self._set_displayed_pulse_width(self.config["current_position"])
         self.pulse_min_var.set(self.config["pulse_min"])
         self.pulse_max_var.set(self.config["pulse_max"])
         self.default_position_var.set(self.config["default_position"])
@@ -291,8 +342,7 @@ class ServoControlWidget:
     #handle component-specific events
     def _on_component_event(self, event_type, *args, **kwargs):
         if event_type == Events.COMPONENT_POSITION_CHANGED:
-            component_name, pulse_width = args
-            self.pulse_width_var.set(pulse_width)
+            self._schedule_position_sync()
             
         elif event_type == Events.COMPONENT_RANGE_CHANGED:
             self.pulse_min_var.set(self.config["pulse_min"])
@@ -319,12 +369,14 @@ class ServoControlWidget:
 
 class ServoControlsManager:
     #manages grouped servo control widgets using component groups order authority
-    def __init__(self, parent, state, send_command_callback):
+    def __init__(self, parent, state, send_command_callback, send_positions_callback=None):
         self.frame = ttk.LabelFrame(parent, text="servo controls")
         self.state = state
         self.send_command = send_command_callback
+        self.send_positions = send_positions_callback
         
-        self.servo_widgets = {}
+        self.servo_widgets = {}  #widgets of the selected group, in group order
+        self.widget_pool = {}  #every widget built so far, hidden ones are reused on group changes
         self.selected_component_group = tk.StringVar()
         
         self._create_controls()
@@ -379,36 +431,50 @@ class ServoControlsManager:
         
         self._create_group_widgets()
     
-    #handle component group selection change with complete widget rebuild
+    #handle component group selection change by swapping pooled widgets in and out
     def _on_group_changed(self):
-        #clear all existing widgets completely
-        for widget in self.controls_container.winfo_children():
-            widget.destroy()
+        #drop pending slider sends before their widgets are hidden
+        for widget in self.servo_widgets.values():
+            widget.cancel_pending_update()
+            widget.frame.pack_forget()
         
-        #clear all widget references to ensure clean rebuild
         self.servo_widgets.clear()
         
         self._create_group_widgets()
     
-    #create widgets for selected component group using group order
+    #show widgets for selected component group using group order, building only ones not pooled yet
     def _create_group_widgets(self):
         selected_group = self.selected_component_group.get()
         component_names = self.state.get_component_group(selected_group)
         
         for component_name in component_names:
-            widget = ServoControlWidget(
-                self.controls_container, 
-                component_name, 
-                self.state, 
-                self.send_command,
-                self._on_component_renamed
-            )
+            widget = self.widget_pool.get(component_name)
+            
+            if widget is None:
+                widget = ServoControlWidget(
+                    self.controls_container, 
+                    component_name, 
+                    self.state, 
+                    self.send_command,
+                    self._on_component_renamed
+                )
+                self.widget_pool[component_name] = widget
+            else:
+                #hidden widgets skip refreshes like reset all, so catch up before showing
+                widget._refresh_all_displays()
+            
             widget.frame.pack(side="left", fill="y", padx=5, pady=5)
             self.servo_widgets[component_name] = widget
     
-    #handle component rename by recreating widgets with component groups order
+    #handle component rename by rebuilding only widgets whose component name no longer exists
     def _on_component_renamed(self):
-        #recreate widgets using component groups authority for order
+        for component_name in list(self.widget_pool):
+            if component_name not in self.state.servo_configurations:
+                widget = self.widget_pool.pop(component_name)
+                self.servo_widgets.pop(component_name, None)
+                widget.destroy()
+        
+        #show the group again using component groups authority for order
         self._on_group_changed()
     
     #handle global events that affect multiple widgets
@@ -436,8 +502,11 @@ class ServoControlsManager:
     def _reset_all_servos(self):
         reset_commands = self.state.reset_all_servos_to_defaults()
         
-        for servo_index, pulse_width in reset_commands:
-            if self.send_command:
+        #send every reset position in one frame when possible
+        if self.send_positions:
+            self.send_positions(reset_commands)
+        elif self.send_command:
+            for servo_index, pulse_width in reset_commands:
                 self.send_command(f"SP:{servo_index}:{pulse_width}")
         
         #refresh visible widgets using component groups order
@@ -4,9 +4,13 @@ import serial
 import serial.tools.list_ports
 import time
 import threading
+from collections import deque
 import psutil
 import os
-from hardware.servo_config import BAUD_RATE, SERIAL_TIMEOUT, MAX_SERVOS
+from hardware.servo_config import (
+    BAUD_RATE, SERIAL_TIMEOUT, SERIAL_WRITE_TIMEOUT, MAX_SERVOS, PORT_SCAN_CACHE_SECONDS,
+    ESP_READY_TIMEOUT, ESP_READY_POLL_MS, ESP_PING_INTERVAL
+)
 from core.event_system import publish, Events
 
 class CPUMonitor:
@@ -75,9 +79,27 @@ class SerialConnection:
         self.frame = ttk.LabelFrame(parent, text="serial connection & system monitor")
         self.log_callback = log_callback
         
-        #connection state
+        #connection state, connected is cached so sends don't query the port
         self.serial_connection = None
+        self.connected = False
+        
+        #non-blocking esp handshake state
+        self.connecting = False
+        self.handshake_buffer = b""
+        self.handshake_deadline = 0.0
+        self.handshake_next_ping = 0.0
         self.servo_config_sent = False
+        self.verbose_logging = True  #per-send log lines, disabled during playback
+        self.disconnect_callbacks = []  #run before the port is closed so writers can stop first
+        
+        #bytes the kernel tx buffer could not take yet, drained before the next write
+        self.pending_writes = deque()
+        self.write_lock = threading.Lock()  #tk thread and playback thread both write
+        self.write_backlogged = False
+        
+        #cached port scan
+        self.ports_cache = None
+        self.ports_cache_time = 0.0
         
         #gui variables
         self.port_var = tk.StringVar()
@@ -115,10 +137,11 @@ class SerialConnection:
         #port selection
         ttk.Label(main_frame, text="port:").grid(row=0, column=0, padx=5, pady=2, sticky="w")
         
-        self.port_combo = ttk.Combobox(main_frame, textvariable=self.port_var, width=12)
+        self.port_combo = ttk.Combobox(main_frame, textvariable=self.port_var, width=12,
+                                       postcommand=self._on_port_dropdown)
         self.port_combo.grid(row=0, column=1, padx=5, pady=2)
         
-        ttk.Button(main_frame, text="refresh", command=self.refresh_ports).grid(row=0, column=2, padx=5, pady=2)
+        ttk.Button(main_frame, text="refresh", command=lambda: self.refresh_ports(force=True)).grid(row=0, column=2, padx=5, pady=2)
         
         #baud rate
         ttk.Label(main_frame, text="baud rate:").grid(row=0, column=3, padx=5, pady=2, sticky="w")
@@ -144,7 +167,8 @@ class SerialConnection:
         self.cpu_label = ttk.Label(status_frame, text=self.cpu_usage_text, foreground="blue")
         self.cpu_label.pack(side="right", padx=5)
         
-        self.refresh_ports()
+        #scan ports once the window has painted
+        self.frame.after_idle(self.refresh_ports)
     
     #update combined status display
     def _update_status_display(self):
@@ -152,9 +176,21 @@ class SerialConnection:
         if hasattr(self, 'cpu_label'):
             self.cpu_label.config(text=self.cpu_usage_text)
     
+    #get available serial ports, reusing a recent scan unless forced
+    def get_available_ports(self, force=False):
+        current_time = time.monotonic()
+        if force or self.ports_cache is None or (current_time - self.ports_cache_time) > PORT_SCAN_CACHE_SECONDS:
+            self.ports_cache = [port.device for port in serial.tools.list_ports.comports()]
+            self.ports_cache_time = current_time
+        return self.ports_cache
+    
+    #update port list when the dropdown opens so hot-plugged devices show up
+    def _on_port_dropdown(self):
+        self.port_combo["values"] = self.get_available_ports()
+    
     #refresh available serial ports
-    def refresh_ports(self):
-        ports = [port.device for port in serial.tools.list_ports.comports()]
+    def refresh_ports(self, force=False):
+        ports = self.get_available_ports(force)
         self.port_combo["values"] = ports
         
         if ports and not self.port_var.get():
@@ -164,13 +200,20 @@ class SerialConnection:
     
     #toggle connection state
     def toggle_connection(self):
-        if not self.is_connected:
+        if self.connecting:
+            return
+        
+        #an open port counts as connected here, so a port dropped by a write error is closed rather than reopened
+        if self.serial_connection is None:
             self.connect()
         else:
             self.disconnect()
     
-    #establish serial connection
+    #open serial connection, the esp handshake then completes without blocking the gui
     def connect(self):
+        if self.connecting:
+            return False
+        
         selected_port = self.port_var.get()
         if not selected_port:
             messagebox.showwarning("warning", "no port selected")
@@ -180,28 +223,101 @@ class SerialConnection:
             self.serial_connection = serial.Serial(
                 port=selected_port, 
                 baudrate=self.baudrate_var.get(), 
-                timeout=SERIAL_TIMEOUT
+                timeout=SERIAL_TIMEOUT,
+                write_timeout=SERIAL_WRITE_TIMEOUT
             )
-            time.sleep(2)  #connection stabilisation
-            
-            self._update_ui_connected(selected_port)
-            publish(Events.CONNECTION_CHANGED, True)
-            
-            #send servo configuration
-            if not self.servo_config_sent:
-                if self.send_command(f"NUM_SERVOS:{MAX_SERVOS}"):
-                    self.servo_config_sent = True
-                    self.log_callback(f"sent servo configuration: {MAX_SERVOS} servos")
-            
-            return True
             
         except Exception as e:
+            self.connected = False
             messagebox.showerror("connection error", str(e))
             self.log_callback(f"connection error: {str(e)}")
             return False
+        
+        #wait for the esp to answer a ping (or finish booting) instead of sleeping
+        self.connecting = True
+        self.handshake_buffer = b""
+        self.handshake_deadline = time.monotonic() + ESP_READY_TIMEOUT
+        self.handshake_next_ping = 0.0
+        
+        self.status_label.config(text=f"connecting to {selected_port}...", foreground="orange")
+        self.connect_button.config(text="connecting...", state="disabled")
+        self.frame.after(ESP_READY_POLL_MS, self._poll_esp_ready, selected_port)
+        return True
+    
+    #poll for the esp ready response on the tk loop
+    def _poll_esp_ready(self, port):
+        if not self.connecting or not self.serial_connection:
+            return
+        
+        current_time = time.monotonic()
+        
+        try:
+            if current_time >= self.handshake_next_ping:
+                self.serial_connection.write(b"PING\n")
+                self.handshake_next_ping = current_time + ESP_PING_INTERVAL
+            
+            bytes_waiting = self.serial_connection.in_waiting
+            if bytes_waiting:
+                self.handshake_buffer += self.serial_connection.read(bytes_waiting)
+                
+        except Exception as e:
+            self.connecting = False
+            self.serial_connection.close()
+            self.serial_connection = None
+            self._update_ui_disconnected()
+            messagebox.showerror("connection error", str(e))
+            self.log_callback(f"connection error: {str(e)}")
+            return
+        
+        esp_ready = b"READY" in self.handshake_buffer or b"ready for commands" in self.handshake_buffer
+        
+        if esp_ready or current_time >= self.handshake_deadline:
+            if not esp_ready:
+                self.log_callback("no ready response from esp, continuing anyway")
+            self._complete_connection(port)
+        else:
+            self.frame.after(ESP_READY_POLL_MS, self._poll_esp_ready, port)
+    
+    #finish connecting once the esp is ready
+    def _complete_connection(self, port):
+        self.connecting = False
+        self.handshake_buffer = b""
+        self.connected = True
+        
+        self._update_ui_connected(port)
+        publish(Events.CONNECTION_CHANGED, True)
+        
+        #send servo configuration
+        if not self.servo_config_sent:
+            if self.send_command(f"NUM_SERVOS:{MAX_SERVOS}"):
+                self.servo_config_sent = True
+                self.log_callback(f"sent servo configuration: {MAX_SERVOS} servos")
+    
+    #register callback to run before the port closes
+    def add_disconnect_callback(self, callback):
+        if callback not in self.disconnect_callbacks:
+            self.disconnect_callbacks.append(callback)
+    
+    #remove disconnect callback
+    def remove_disconnect_callback(self, callback):
+        if callback in self.disconnect_callbacks:
+            self.disconnect_callbacks.remove(callback)
+    
+    #let anything still writing to the port finish before it closes
+    def _run_disconnect_callbacks(self):
+        for callback in self.disconnect_callbacks[:]:
+            try:
+                callback()
+            except Exception as e:
+                self.log_callback(f"disconnect callback error: {str(e)}")
     
     #close serial connection
     def disconnect(self):
+        self._run_disconnect_callbacks()
+        
+        self.connected = False
+        self.connecting = False
+        self._clear_pending_writes()
         if self.serial_connection:
             self.serial_connection.close()
             self.serial_connection = None
@@ -220,51 +336,154 @@ class SerialConnection:
             if not command.endswith('\n'):
                 command += '\n'
             
-            self.serial_connection.write(command.encode('utf-8'))
-            self.log_callback(f"sent: {command.strip()}")
+            self._write_frame(command.encode('utf-8'))
+            if self.verbose_logging:
+                self.log_callback(f"sent: {command.strip()}")
             return True
             
         except Exception as e:
-            self.log_callback(f"error sending command: {str(e)}")
+            self._handle_write_error("error sending command", e)
             return False
     
-    #send multiple commands with timing
-    def send_batch_commands(self, commands, delay_between=0.005):
-        if not commands or not self.is_connected:
+    #send all servo pulse widths for one step as a single batch frame
+    def send_servo_positions(self, servo_positions):
+        if not servo_positions or not self.is_connected:
             return 0
         
-        success_count = 0
-        for command in commands:
-            if self.send_command(command):
-                success_count += 1
-                time.sleep(delay_between)
-            else:
-                break
+        try:
+            #build the frame directly as bytes to skip per-entry str formatting and encoding
+            frame = b"SB:" + b",".join([b"%d=%d" % (servo_index, pulse_width) for servo_index, pulse_width in servo_positions]) + b"\n"
+            self._write_frame(frame)
+            if self.verbose_logging:
+                self.log_callback(f"sent: batch of {len(servo_positions)} servo positions")
+            return len(servo_positions)
+            
+        except Exception as e:
+            self._handle_write_error("error sending batch", e)
+            return 0
+    
+    #send one pulse width to every active servo
+    def send_broadcast_position(self, pulse_width):
+        if not self.is_connected:
+            return False
+        
+        try:
+            self._write_frame(b"SA:%d\n" % pulse_width)
+            if self.verbose_logging:
+                self.log_callback(f"sent: SA:{pulse_width}")
+            return True
+            
+        except Exception as e:
+            self._handle_write_error("error sending command", e)
+            return False
+    
+    #write without waiting on the kernel, anything not accepted is queued behind earlier bytes
+    def _write_frame(self, data):
+        with self.write_lock:
+            self._drain_pending_writes()
+            
+            if self.pending_writes:
+                self.pending_writes.append(data)
+                return
+            
+            try:
+                written = self.serial_connection.write(data)
+            except serial.SerialTimeoutException:
+                written = 0
+            
+            if written is not None and written < len(data):
+                self.pending_writes.append(data[written:])
+                self._note_backlog()
+    
+    #push queued bytes out until the tx buffer fills again, caller holds write_lock
+    def _drain_pending_writes(self):
+        while self.pending_writes:
+            data = self.pending_writes[0]
+            try:
+                written = self.serial_connection.write(data)
+            except serial.SerialTimeoutException:
+                return
+            
+            if written is not None and written < len(data):
+                self.pending_writes[0] = data[written:]
+                return
+            self.pending_writes.popleft()
+        
+        if self.write_backlogged:
+            self.write_backlogged = False
+            if self.verbose_logging:
+                self.log_callback("serial transmit backlog cleared")
+    
+    #log once when writes start queueing rather than on every retry
+    def _note_backlog(self):
+        if not self.write_backlogged:
+            self.write_backlogged = True
+            if self.verbose_logging:
+                self.log_callback("serial transmit buffer full, queueing writes")
+    
+    #retry queued bytes, returns true if some are still waiting
+    def flush_pending_writes(self):
+        if not self.is_connected:
+            return False
+        
+        try:
+            with self.write_lock:
+                self._drain_pending_writes()
+                return bool(self.pending_writes)
+        except Exception as e:
+            self._handle_write_error("error sending queued data", e)
+            return False
+    
+    #check for queued bytes without touching the port
+    def has_pending_writes(self):
+        return bool(self.pending_writes)
+    
+    #drop queued bytes once the port is going away
+    def _clear_pending_writes(self):
+        with self.write_lock:
+            self.pending_writes.clear()
+            self.write_backlogged = False
+    
+    #log write failures, a serial exception means the port is gone so stop sending and disconnect properly
+    def _handle_write_error(self, message, error):
+        self.log_callback(f"{message}: {str(error)}")
         
-        return success_count
+        if isinstance(error, serial.SerialException) and self.connected:
+            self.connected = False
+            #writes can fail on the playback thread, so the disconnect runs on the tk thread
+            self.frame.after(0, self._disconnect_after_write_error, self.serial_connection)
+    
+    #close the failed port unless it was already closed or replaced in the meantime
+    def _disconnect_after_write_error(self, failed_connection):
+        if failed_connection is not None and self.serial_connection is failed_connection:
+            self.disconnect()
     
     #update ui for connected state
     def _update_ui_connected(self, port):
         self.status_label.config(text=f"connected to {port}", foreground="green")
-        self.connect_button.config(text="disconnect")
+        self.connect_button.config(text="disconnect", state="normal")
         self.log_callback(f"connected to {port}")
     
     #update ui for disconnected state
     def _update_ui_disconnected(self):
         self.status_label.config(text="disconnected", foreground="red")
-        self.connect_button.config(text="connect")
+        self.connect_button.config(text="connect", state="normal")
     
-    #check connection status
+    #check connection status using the cached flag
     @property
     def is_connected(self):
-        return self.serial_connection is not None and self.serial_connection.is_open
+        return self.connected and self.serial_connection is not None
     
     #cleanup resources including cpu monitoring
     def cleanup(self):
         #stop cpu monitoring
         self.cpu_monitor.stop_monitoring()
         
-        #close serial connection
+        #stop anything still writing, then close serial connection
+        self._run_disconnect_callbacks()
+        self.connected = False
+        self.connecting = False
+        self._clear_pending_writes()
         if self.serial_connection:
             self.serial_connection.close()
             self.serial_connection = None
\ No newline at end of file
@@ -5,6 +5,12 @@ MAX_SERVOS = 25
 BAUD_RATE = 115200
 PWM_FREQUENCY = 50  #fixed frequency for all servos
 SERIAL_TIMEOUT = 1.0
+PORT_SCAN_CACHE_SECONDS = 2.0  #reuse a port scan younger than this
+ESP_READY_TIMEOUT = 2.0  #max wait for the esp to answer after opening the port
+ESP_READY_POLL_MS = 50
+ESP_PING_INTERVAL = 0.25
+SERIAL_WRITE_TIMEOUT = 0  #non-blocking writes, bytes the tx buffer can't take are queued
+SERIAL_DRAIN_INTERVAL = 0.005  #playback retry interval while queued bytes are pending
 
 #default component configurations
 DEFAULT_COMPONENT_CONFIGS = {